@@ -4,7 +4,21 @@ Adapter-specific helper functions.
 Provides utility functions specifically for working with language adapters.
 """
 
+import functools
+import hashlib
+import os
+import platform
+import shutil
+import subprocess
 import sys
+from typing import List, Optional, Tuple
+
+# Evaluated once, the platform does not change at runtime
+_IS_WINDOWS = platform.system() == "Windows"
+_EXE_SUFFIX = ".exe" if _IS_WINDOWS else ""
+
+# Cached builds kept per language; the least recently used ones are removed beyond this
+BUILD_CACHE_MAX_ENTRIES = 32
 
 
 def get_emoji_safe_display(adapter):
@@ -17,14 +31,25 @@ def get_emoji_safe_display(adapter):
     Returns:
         str: Display string with emoji on UTF-8 systems, without on others
     """
+    try:
+        return _emoji_safe_display(adapter.emoji, adapter.display_name, sys.stdout.encoding or 'utf-8')
+    except AttributeError:
+        return adapter.display_name
+
+
+@functools.lru_cache(maxsize=32)
+def _emoji_safe_display(emoji, display_name, encoding):
+    # Memoized: the result only depends on the labels and the console encoding
+    test = f"{emoji} {display_name}"
+    if test.isascii():
+        return test
     try:
         # Try to encode the emoji
-        test = f"{adapter.emoji} {adapter.display_name}"
-        test.encode(sys.stdout.encoding or 'utf-8')
+        test.encode(encoding)
         return test
-    except (UnicodeEncodeError, AttributeError):
+    except (UnicodeEncodeError, LookupError):
         # Fallback without emoji
-        return adapter.display_name
+        return display_name
 
 
 def format_language_list(adapters):
@@ -46,3 +71,161 @@ def format_language_list(adapters):
         return str(adapters)
     
     return ', '.join(languages)
+
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """
+    Look up an executable on the PATH, remembering the result.
+    
+    Each shutil.which() call scans every PATH directory; the cache is
+    cleared whenever an adapter is registered.
+    
+    Args:
+        name: Name of the executable (e.g., 'g++')
+        
+    Returns:
+        str: Full path of the executable, or None if not found
+    """
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_compiler_identity(compiler: str, version_args: Tuple[str, ...] = ("--version",),
+                          native: bool = False) -> Tuple[str, ...]:
+    """
+    Describe an installed compiler for build cache keys, so that an upgraded
+    toolchain never reuses binaries (and compile times) of the previous one.
+    
+    Args:
+        compiler: Compiler executable (e.g. 'g++', 'rustc')
+        version_args: Arguments that make the compiler print its version
+        native: Whether the build uses -march=native, which depends on the host CPU
+        
+    Returns:
+        tuple: Resolved compiler path, its version output and, for native builds,
+        the target options it selects on this host
+    """
+    def output(cmd):
+        try:
+            proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  stdin=subprocess.DEVNULL, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            return ""
+        return proc.stdout.decode("utf-8", errors="replace") if proc.returncode == 0 else ""
+    
+    identity = [find_executable(compiler) or compiler, output([compiler, *version_args])]
+    if native:
+        # GCC lists the resolved -march/-mtune and ISA extensions; clang prints
+        # its -target-cpu/-target-feature arguments with -###
+        target = output([compiler, "-march=native", "-Q", "--help=target"])
+        if not target:
+            target = output([compiler, "-march=native", "-###", "-x", "c++", "-c", os.devnull])
+        identity.append(target or platform.processor() or platform.machine())
+    return tuple(identity)
+
+
+def get_build_cache_path(language: str, source_file: str, build_args: List[str]) -> str:
+    """
+    Get the build cache entry for a source file.
+    
+    The key covers the source contents and the build arguments (compiler and
+    flags), so any change to one of them results in a fresh compilation.
+    
+    Args:
+        language: Name of the language, used as cache subdirectory
+        source_file: Path to the source file
+        build_args: Compiler name and flags used for the build
+        
+    Returns:
+        str: Path of the cached binary (which may not exist yet)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(source_file, "rb") as f:
+        digest.update(f.read())
+    digest.update(b"\0".join(arg.encode() for arg in build_args))
+    
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "codebench", language, digest.hexdigest() + _EXE_SUFFIX)
+
+
+def restore_cached_build(cache_path: str, binary: str) -> Optional[float]:
+    """
+    Place a cached binary at the expected location.
+    
+    Args:
+        cache_path: Path of the cached binary
+        binary: Path where the binary is expected
+        
+    Returns:
+        float: Compilation time of the original build, or None on a cache miss
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path + ".time", "r") as f:
+            compilation_time = float(f.read())
+        if os.path.exists(binary):
+            os.remove(binary)
+        # Mark the entry as recently used, see prune_build_cache()
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        try:
+            os.link(cache_path, binary)
+        except OSError:
+            shutil.copy2(cache_path, binary)
+    except (OSError, ValueError):
+        return None
+    return compilation_time
+
+
+def store_cached_build(binary: str, cache_path: str, compilation_time: float) -> None:
+    """
+    Store a freshly compiled binary and its compilation time in the cache.
+    
+    Args:
+        binary: Path to the compiled binary
+        cache_path: Path of the cache entry to create
+        compilation_time: Measured compilation time in seconds
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to temporary names first so concurrent runs never see partial entries
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        shutil.copy2(binary, tmp_path)
+        with open(tmp_path + ".time", "w") as f:
+            f.write(repr(compilation_time))
+        os.replace(tmp_path + ".time", cache_path + ".time")
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache compiled binary: {e}")
+        return
+    prune_build_cache(os.path.dirname(cache_path))
+
+
+def prune_build_cache(cache_dir: str, max_entries: int = BUILD_CACHE_MAX_ENTRIES) -> None:
+    """
+    Remove the least recently used builds of a cache directory beyond max_entries.
+    
+    Args:
+        cache_dir: Cache directory of one language
+        max_entries: Number of builds to keep
+    """
+    try:
+        entries = []
+        for entry in os.scandir(cache_dir):
+            # Binaries only; sidecars go with their binary, temporary files belong to running builds
+            if entry.name.endswith((".time", ".tmp")):
+                continue
+            entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        for stale in (path, path + ".time"):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
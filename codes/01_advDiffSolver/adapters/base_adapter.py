@@ -6,7 +6,8 @@ This enables a consistent way to handle different programming languages.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+import os
 import subprocess
 import time
 
@@ -21,6 +22,13 @@ class LanguageAdapter(ABC):
     - Cleaning up temporary files
     """
     
+    # Cost of one perf_counter_ns() reading, measured on first use
+    _timer_overhead_ns: Optional[int] = None
+    
+    # Config files written when the caller does not name any, and the warm-up content
+    _DEFAULT_CONFIG_FILES = ("config.txt", "input.txt")
+    _WARMUP_CONFIG = b"warmup\n"
+    
     def __init__(self):
         """Initialize the adapter with language-specific properties."""
         self.name: str = ""
@@ -28,7 +36,74 @@ class LanguageAdapter(ABC):
         self.requires_compilation: bool = False
         self.display_name: str = ""
         self.emoji: str = "📄"
-        self.compilation_time: float = 0.0  # Track compilation time
+        self.compilation_time_ns: int = 0  # Track compilation time (integer nanoseconds)
+        # How programs receive their configuration: "file" writes the config
+        # files, "stdin" pipes the content to the program's standard input
+        self.config_mode: str = "file"
+        # CPU core the measured programs are pinned to (None: no pinning, Linux only)
+        self.pin_core: Optional[int] = None
+        # Lower-cased extensions for str.endswith, built on first use
+        # (subclasses set self.extensions after this constructor)
+        self._extensions_tuple: Optional[Tuple[str, ...]] = None
+    
+    @classmethod
+    def timer_overhead_ns(cls) -> int:
+        """
+        Get the overhead of a perf_counter_ns() reading, which is subtracted from measured times.
+        
+        Returns:
+            Smallest delta between back-to-back readings over 1000 calls, in nanoseconds
+        """
+        if LanguageAdapter._timer_overhead_ns is None:
+            overhead = None
+            prev = time.perf_counter_ns()
+            for _ in range(1000):
+                now = time.perf_counter_ns()
+                # The minimum is robust to preemption between two readings
+                if overhead is None or now - prev < overhead:
+                    overhead = now - prev
+                prev = now
+            LanguageAdapter._timer_overhead_ns = overhead
+        return LanguageAdapter._timer_overhead_ns
+    
+    def elapsed_ns(self, start_ns: int, end_ns: int) -> int:
+        """
+        Convert two perf_counter_ns() readings into an elapsed time, corrected for the timer overhead.
+        
+        Args:
+            start_ns: Reading taken before the measured operation
+            end_ns: Reading taken after the measured operation
+            
+        Returns:
+            Elapsed time in nanoseconds (never negative)
+        """
+        return max(end_ns - start_ns - self.timer_overhead_ns(), 0)
+    
+    @property
+    def compilation_time(self) -> float:
+        """Compilation time in seconds (stored as compilation_time_ns)."""
+        return self.compilation_time_ns * 1e-9
+    
+    @compilation_time.setter
+    def compilation_time(self, seconds: float) -> None:
+        self.compilation_time_ns = round(seconds * 1e9)
+    
+    def _make_metrics(self, execution_ns: int) -> Dict:
+        """
+        Build the metrics of one run; times are summed in integer nanoseconds.
+        
+        Args:
+            execution_ns: Measured execution time in nanoseconds
+            
+        Returns:
+            Dictionary with runtime, total_time and compilation_time in seconds, and runtime_ns
+        """
+        return {
+            "runtime": execution_ns * 1e-9,
+            "total_time": (self.compilation_time_ns + execution_ns) * 1e-9,
+            "compilation_time": self.compilation_time,
+            "runtime_ns": execution_ns
+        }
     
     @abstractmethod
     def prepare(self, source_file: str) -> Tuple[bool, str, str]:
@@ -43,6 +118,17 @@ class LanguageAdapter(ABC):
         """
         pass
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """
+        Get the command of the interpreter or compiler used by this adapter.
+        
+        Used to pre-warm the tool (e.g. with --version) before benchmarking.
+        
+        Returns:
+            List of command arguments, or None if there is no tool to pre-warm
+        """
+        return None
+    
     @abstractmethod
     def get_execution_command(self, prepared_file: str) -> List[str]:
         """
@@ -56,44 +142,66 @@ class LanguageAdapter(ABC):
         """
         pass
     
+    def _get_preexec_fn(self):
+        """Get the function run in the child before exec, pinning it to pin_core if set."""
+        if self.pin_core is None or not hasattr(os, "sched_setaffinity"):
+            return None
+        core = self.pin_core
+        return lambda: os.sched_setaffinity(0, {core})
+    
     def execute(self, prepared_file: str, config_content: str, 
-                config_files: Optional[List[str]] = None) -> Dict:
+                config_files: Optional[Sequence[str]] = None,
+                cwd: Optional[str] = None) -> Dict:
         """
         Execute the program with the given configuration.
         
         Args:
             prepared_file: Path to the prepared/compiled program
-            config_content: Content to write to config file
-            config_files: List of config file names to write to
+            config_content: Content to write to config file (or to stdin, see config_mode)
+            config_files: Config file names to write to (default: config.txt and input.txt)
+            cwd: Directory to run the program in (default: current directory);
+                 prepared_file must then be an absolute path
             
         Returns:
-            Dictionary with runtime, total_time, stdout, stderr, and returncode
+            Dictionary with runtime, total_time, compilation_time and runtime_ns
         """
-        if config_files is None:
-            config_files = ["config.txt", "input.txt"]
-        
-        # Write config content to files
-        for config_filename in config_files:
-            with open(config_filename, "w") as f:
-                f.write(config_content)
+        use_stdin = self.config_mode == "stdin"
+        config_bytes = config_content.encode("utf-8")
+        if not use_stdin:
+            self._write_config_files(config_bytes, config_files, cwd)
         
         # Get execution command
         cmd = self.get_execution_command(prepared_file)
+        stdin = subprocess.PIPE if use_stdin else None
+        stdin_data = config_bytes if use_stdin else None
         
-        # Measure execution time
-        start = time.time()
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate()
-        end = time.time()
+        # Measure execution time (monotonic clock, only meaningful as a difference)
+        start = time.perf_counter_ns()
+        proc = subprocess.Popen(cmd, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd,
+                                preexec_fn=self._get_preexec_fn())
+        stdout, stderr = proc.communicate(stdin_data)
+        end = time.perf_counter_ns()
         
-        execution_time = end - start
-        total_time = self.compilation_time + execution_time
+        return self._make_metrics(self.elapsed_ns(start, end))
+    
+    def _write_config_files(self, content: bytes, config_files: Optional[Sequence[str]] = None,
+                            cwd: Optional[str] = None) -> None:
+        """
+        Write the configuration to the config files (unbuffered, no text layer).
         
-        return {
-            "runtime": execution_time,
-            "total_time": total_time,
-            "compilation_time": self.compilation_time
-        }
+        Args:
+            content: Encoded configuration
+            config_files: Config file names (default: config.txt and input.txt)
+            cwd: Directory to write the files in (default: current directory)
+        """
+        if config_files is None:
+            config_files = self._DEFAULT_CONFIG_FILES
+        for config_filename in config_files:
+            fd = os.open(os.path.join(cwd or "", config_filename), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
     
     def warmup(self, prepared_file: str) -> bool:
         """
@@ -106,14 +214,24 @@ class LanguageAdapter(ABC):
             True if warm-up successful, False otherwise
         """
         try:
-            warmup_config = "warmup\n"
-            for config_filename in ["config.txt", "input.txt"]:
-                with open(config_filename, "w") as f:
-                    f.write(warmup_config)
+            use_stdin = self.config_mode == "stdin"
+            if not use_stdin:
+                self._write_config_files(self._WARMUP_CONFIG)
             
             cmd = self.get_execution_command(prepared_file)
-            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            proc.communicate(timeout=10)
+            # The output of the warm-up run is not needed
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if use_stdin else subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            try:
+                if use_stdin:
+                    proc.communicate(self._WARMUP_CONFIG, timeout=10)
+                else:
+                    proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                # Do not leave the program running next to the measurements
+                proc.kill()
+                proc.wait()
+                raise
             print(f"  {self.display_name} warm-up complete")
             return True
         except Exception as e:
@@ -140,7 +258,9 @@ class LanguageAdapter(ABC):
         Returns:
             True if this adapter can handle the file, False otherwise
         """
-        return any(filename.lower().endswith(ext) for ext in self.extensions)
+        if self._extensions_tuple is None:
+            self._extensions_tuple = tuple(ext.lower() for ext in self.extensions)
+        return filename.lower().endswith(self._extensions_tuple)
     
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.name}>"
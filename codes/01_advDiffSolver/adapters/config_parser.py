@@ -2,17 +2,34 @@
 Config Parser for Language-Specific Compiler Options
 """
 
+import os
+import re
+
+# "<language>: <flags>" lines; the leading letter excludes numeric input lines and comments
+_LINE_RE = re.compile(r"^\s*([A-Za-z_][\w+]*)\s*:\s*(.*?)\s*$")
+
+# Parsed configs by (path, modification time), so each adapter does not re-read the file
+_cache = {}
+
 
 def parse_compiler_config(file_path: str) -> dict:
     """Parse compiler config from config.txt"""
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+    except OSError:
+        return {}
+    if key in _cache:
+        return dict(_cache[key])
+
     config = {}
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if ':' in line and not line[0].isdigit() and not line.startswith('#'):
-                    lang, flags = line.split(':', 1)
-                    config[lang.strip().lower()] = flags.strip()
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        for line in data.decode('utf-8', 'replace').splitlines():
+            m = _LINE_RE.match(line)
+            if m:
+                config[m.group(1).lower()] = m.group(2)
     except Exception:
         pass
-    return config
+    _cache[key] = config
+    return dict(config)
@@ -6,17 +6,27 @@ Handles compilation and execution of C++ programs with support for multiple comp
 
 import os
 import platform
-import shutil
 import subprocess
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from .base_adapter import LanguageAdapter
+from .adapter_helpers import (
+    find_executable, get_build_cache_path, get_compiler_identity, restore_cached_build, store_cached_build
+)
 from .config_parser import parse_compiler_config
 
+# Evaluated once, the platform does not change at runtime
+_IS_WINDOWS = platform.system() == "Windows"
+_EXE_SUFFIX = ".exe" if _IS_WINDOWS else ""
+
 
 class CppAdapter(LanguageAdapter):
     """Adapter for C++ programs."""
     
+    # Default flags when none are configured (no -ffast-math, results must stay IEEE-exact)
+    DEFAULT_FLAGS = ["-O3", "-march=native", "-DNDEBUG"]
+    MSVC_DEFAULT_FLAGS = ["/O2", "/DNDEBUG"]
+    
     def __init__(self, config_file: str = None):
         super().__init__()
         self.name = "cpp"
@@ -25,17 +35,50 @@ class CppAdapter(LanguageAdapter):
         self.display_name = "C++"
         self.emoji = "⚙️"
         self._compiled_binary = None
-        self._custom_flags = self._load_flags(config_file)
+        # Flags are read at construction, before any prepare()/warmup() can
+        # overwrite config.txt/input.txt in the working directory
         self._custom_flags = self._load_flags(config_file)
     
-    def _load_flags(self, config_file: str) -> List[str]:
-        """Load compiler flags from config file"""
+    def _load_flags(self, config_file: str) -> Optional[List[str]]:
+        """Load compiler flags from config file (None means compiler defaults)"""
         if not config_file or not os.path.exists(config_file):
-            return ["-O2"]
+            return None
         
         config = parse_compiler_config(config_file)
-        flags_str = config.get("cpp", "-O2")
-        return flags_str.split() if flags_str else ["-O2"]
+        flags_str = config.get("cpp", "")
+        return flags_str.split() if flags_str else None
+    
+    def set_flags(self, flags: Optional[List[str]]) -> None:
+        """
+        Override the compiler flags.
+        
+        Args:
+            flags: Compiler flags, or None to use the defaults
+        """
+        self._custom_flags = flags
+    
+    def _get_flags(self, compiler_name: str) -> List[str]:
+        """Get the effective compiler flags for the given compiler"""
+        if self._custom_flags is not None:
+            return self._custom_flags
+        return self.MSVC_DEFAULT_FLAGS if compiler_name == "msvc" else self.DEFAULT_FLAGS
+    
+    def _get_compiler_wrapper(self) -> List[str]:
+        """
+        Get a compiler cache wrapper (ccache or sccache) to prefix the compiler with.
+        
+        Opt-in with CODEBENCH_CCACHE=1: a wrapper cache hit makes the measured
+        compilation time the cache lookup time, not the program's compile time.
+        
+        Returns:
+            List with the wrapper command, or an empty list
+        """
+        if os.environ.get("CODEBENCH_CCACHE", "") in ("", "0"):
+            return []
+        for wrapper in ("ccache", "sccache"):
+            if find_executable(wrapper):
+                return [wrapper]
+        return []
     
     def _find_compiler(self) -> Tuple[str, List[str]]:
         """
@@ -48,15 +91,15 @@ class CppAdapter(LanguageAdapter):
             RuntimeError: If no compiler is found
         """
         # Try g++
-        if shutil.which("g++"):
-            return "g++", ["g++"]
+        if find_executable("g++"):
+            return "g++", self._get_compiler_wrapper() + ["g++"]
         
         # Try clang++
-        if shutil.which("clang++"):
-            return "clang++", ["clang++"]
+        if find_executable("clang++"):
+            return "clang++", self._get_compiler_wrapper() + ["clang++"]
         
         # Try MSVC on Windows
-        if platform.system() == "Windows" and shutil.which("cl"):
+        if _IS_WINDOWS and find_executable("cl"):
             return "msvc", ["cl"]
         
         # No compiler found
@@ -67,6 +110,13 @@ class CppAdapter(LanguageAdapter):
             "  - Or Clang for Windows"
         )
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the C++ compiler, or None if there is none."""
+        try:
+            return self._find_compiler()[1]
+        except RuntimeError:
+            return None
+    
     def _get_binary_name(self, source_file: str) -> str:
         """
         Get the output binary name based on the platform.
@@ -78,14 +128,11 @@ class CppAdapter(LanguageAdapter):
             Name of the binary to create
         """
         base_name = os.path.splitext(os.path.basename(source_file))[0]
-        if platform.system() == "Windows":
-            return f"temp_{base_name}_exec.exe"
-        else:
-            return f"temp_{base_name}_exec"
+        return f"temp_{base_name}_exec{_EXE_SUFFIX}"
     
     def prepare(self, source_file: str) -> Tuple[bool, str, str]:
         """
-        Compile the C++ source file.
+        Compile the C++ source file, reusing a cached build when available.
         
         Args:
             source_file: Path to the C++ source file
@@ -97,32 +144,49 @@ class CppAdapter(LanguageAdapter):
             compiler_name, compiler_cmd = self._find_compiler()
             binary = self._get_binary_name(source_file)
             
+            flags = self._get_flags(compiler_name)
+            # The key covers the compiler build and, with -march=native, the host CPU, so an
+            # upgraded compiler or a home directory shared across hosts never reuses a stale binary
+            native = any(flag.startswith(("-march=native", "-mcpu=native", "-mtune=native")) for flag in flags)
+            identity = get_compiler_identity(compiler_cmd[-1], native=native)
+            cache_path = get_build_cache_path(self.name, source_file, [compiler_name, *identity] + flags)
+            cached_time = restore_cached_build(cache_path, binary)
+            if cached_time is not None:
+                # Report the compilation time of the original build
+                self.compilation_time = cached_time
+                print(f"Using cached build (originally compiled in {self.compilation_time:.3f}s)")
+                # No warm-up run, the cached binary is already in the page cache
+                self._compiled_binary = binary
+                return True, binary, ""
+            
             # Build compilation command based on compiler
             if compiler_name == "msvc":
-                msvc_flags = [f.replace("-O", "/O") for f in self._custom_flags]
+                msvc_flags = [f.replace("-O", "/O") for f in flags]
                 compile_cmd = compiler_cmd + msvc_flags + [f"/Fe:{binary}", source_file]
             else:
-                compile_cmd = compiler_cmd + [source_file] + self._custom_flags + ["-o", binary]
+                # -pipe avoids writing intermediate files between compilation stages
+                compile_cmd = compiler_cmd + [source_file, "-pipe"] + flags + ["-o", binary]
             
             print(f"Compiling with: {' '.join(compile_cmd)}")
             
-            # Measure compilation time
-            compile_start = time.time()
+            # Measure compilation time (monotonic clock)
+            compile_start = time.perf_counter_ns()
             
-            # Compile
-            result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True
-            )
+            # Compile (stderr is only decoded when the compilation fails)
+            proc = subprocess.Popen(compile_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            _, stderr = proc.communicate()
             
-            compile_end = time.time()
-            self.compilation_time = compile_end - compile_start
+            compile_end = time.perf_counter_ns()
+            self.compilation_time_ns = self.elapsed_ns(compile_start, compile_end)
             
             print(f"Compilation took {self.compilation_time:.3f}s")
             
-            if result.returncode != 0:
-                return False, "", f"Compilation failed: {result.stderr}"
+            if proc.returncode != 0:
+                return False, "", f"Compilation failed: {stderr.decode('utf-8', errors='replace')}"
+            
+            # A time measured through ccache/sccache may be a cache lookup, do not persist it
+            if not self._get_compiler_wrapper():
+                store_cached_build(binary, cache_path, self.compilation_time)
             
             # Perform warm-up run
             print("Performing warm-up run for C++ binary...")
@@ -145,7 +209,7 @@ class CppAdapter(LanguageAdapter):
             List containing the binary path (with ./ prefix on Unix)
         """
         # On Unix-like systems, need ./ prefix for local executables
-        if platform.system() != "Windows" and not prepared_file.startswith("./"):
+        if not _IS_WINDOWS and not os.path.dirname(prepared_file):
             return [f"./{prepared_file}"]
         return [prepared_file]
     
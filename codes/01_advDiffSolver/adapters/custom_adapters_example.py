@@ -16,11 +16,18 @@ Usage:
 
 import os
 import platform
-import shutil
 import subprocess
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
 from adapters.base_adapter import LanguageAdapter
-from adapters.registry import register_custom_adapter
+from adapters.adapter_helpers import (
+    find_executable, get_build_cache_path, get_compiler_identity, restore_cached_build, store_cached_build
+)
+from adapters.registry import get_registry, register_custom_adapter
+
+# Evaluated once, the platform does not change at runtime
+_IS_WINDOWS = platform.system() == "Windows"
+_EXE_SUFFIX = ".exe" if _IS_WINDOWS else ""
 
 
 class RustAdapter(LanguageAdapter):
@@ -42,10 +49,7 @@ class RustAdapter(LanguageAdapter):
     def _get_binary_name(self, source_file: str) -> str:
         """Get the output binary name based on the platform."""
         base_name = os.path.splitext(os.path.basename(source_file))[0]
-        if platform.system() == "Windows":
-            return f"temp_{base_name}_rust.exe"
-        else:
-            return f"temp_{base_name}_rust"
+        return f"temp_{base_name}_rust{_EXE_SUFFIX}"
     
     def prepare(self, source_file: str) -> Tuple[bool, str, str]:
         """
@@ -59,24 +63,35 @@ class RustAdapter(LanguageAdapter):
         """
         try:
             # Check if rustc is installed
-            if not shutil.which("rustc"):
+            if not find_executable("rustc"):
                 return False, "", "Rust compiler (rustc) not found. Please install Rust from https://rustup.rs/"
             
             binary = self._get_binary_name(source_file)
             
+            # Reuse a previous build of the same source, flags and toolchain
+            identity = get_compiler_identity("rustc", ("-vV",))
+            cache_path = get_build_cache_path(self.name, source_file, ["rustc", *identity, "-O"])
+            cached_time = restore_cached_build(cache_path, binary)
+            if cached_time is not None:
+                self.compilation_time = cached_time
+                print(f"Using cached Rust build (originally compiled in {self.compilation_time:.3f}s)")
+                self._compiled_binary = binary
+                return True, binary, ""
+            
             # Compile with optimization
             compile_cmd = ["rustc", source_file, "-O", "-o", binary]
             
             print(f"Compiling Rust with: {' '.join(compile_cmd)}")
             
-            result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True
-            )
+            compile_start = time.perf_counter_ns()
+            proc = subprocess.Popen(compile_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            _, stderr = proc.communicate()
+            self.compilation_time_ns = self.elapsed_ns(compile_start, time.perf_counter_ns())
+            
+            if proc.returncode != 0:
+                return False, "", f"Rust compilation failed: {stderr.decode('utf-8', errors='replace')}"
             
-            if result.returncode != 0:
-                return False, "", f"Rust compilation failed: {result.stderr}"
+            store_cached_build(binary, cache_path, self.compilation_time)
             
             # Perform warm-up run
             print("Performing warm-up run for Rust binary...")
@@ -88,6 +103,10 @@ class RustAdapter(LanguageAdapter):
         except Exception as e:
             return False, "", str(e)
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the Rust compiler."""
+        return ["rustc"] if find_executable("rustc") else None
+    
     def get_execution_command(self, prepared_file: str) -> List[str]:
         """
         Get the command to execute a compiled Rust program.
@@ -99,7 +118,7 @@ class RustAdapter(LanguageAdapter):
             List containing the binary path
         """
         # On Unix-like systems, need ./ prefix for local executables
-        if platform.system() != "Windows" and not prepared_file.startswith("./"):
+        if not _IS_WINDOWS and not os.path.dirname(prepared_file):
             return [f"./{prepared_file}"]
         return [prepared_file]
     
@@ -147,11 +166,15 @@ class JavaScriptAdapter(LanguageAdapter):
         Returns:
             Tuple of (success, source_file, error_message)
         """
-        if not shutil.which("node"):
+        if not find_executable("node"):
             return False, "", "Node.js not found. Please install Node.js from https://nodejs.org/"
         
         return True, source_file, ""
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the Node.js interpreter."""
+        return ["node"] if find_executable("node") else None
+    
     def get_execution_command(self, prepared_file: str) -> List[str]:
         """
         Get the command to execute a JavaScript program.
@@ -192,10 +215,7 @@ class GoAdapter(LanguageAdapter):
     def _get_binary_name(self, source_file: str) -> str:
         """Get the output binary name based on the platform."""
         base_name = os.path.splitext(os.path.basename(source_file))[0]
-        if platform.system() == "Windows":
-            return f"temp_{base_name}_go.exe"
-        else:
-            return f"temp_{base_name}_go"
+        return f"temp_{base_name}_go{_EXE_SUFFIX}"
     
     def prepare(self, source_file: str) -> Tuple[bool, str, str]:
         """
@@ -209,24 +229,35 @@ class GoAdapter(LanguageAdapter):
         """
         try:
             # Check if go is installed
-            if not shutil.which("go"):
+            if not find_executable("go"):
                 return False, "", "Go compiler not found. Please install Go from https://golang.org/"
             
             binary = self._get_binary_name(source_file)
             
+            # Reuse a previous build of the same source and toolchain
+            identity = get_compiler_identity("go", ("version",))
+            cache_path = get_build_cache_path(self.name, source_file, ["go", *identity, "build"])
+            cached_time = restore_cached_build(cache_path, binary)
+            if cached_time is not None:
+                self.compilation_time = cached_time
+                print(f"Using cached Go build (originally compiled in {self.compilation_time:.3f}s)")
+                self._compiled_binary = binary
+                return True, binary, ""
+            
             # Compile
             compile_cmd = ["go", "build", "-o", binary, source_file]
             
             print(f"Compiling Go with: {' '.join(compile_cmd)}")
             
-            result = subprocess.run(
-                compile_cmd,
-                capture_output=True,
-                text=True
-            )
+            compile_start = time.perf_counter_ns()
+            proc = subprocess.Popen(compile_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            _, stderr = proc.communicate()
+            self.compilation_time_ns = self.elapsed_ns(compile_start, time.perf_counter_ns())
+            
+            if proc.returncode != 0:
+                return False, "", f"Go compilation failed: {stderr.decode('utf-8', errors='replace')}"
             
-            if result.returncode != 0:
-                return False, "", f"Go compilation failed: {result.stderr}"
+            store_cached_build(binary, cache_path, self.compilation_time)
             
             # Perform warm-up run
             print("Performing warm-up run for Go binary...")
@@ -238,10 +269,14 @@ class GoAdapter(LanguageAdapter):
         except Exception as e:
             return False, "", str(e)
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the Go toolchain."""
+        return ["go"] if find_executable("go") else None
+    
     def get_execution_command(self, prepared_file: str) -> List[str]:
         """Get the command to execute a compiled Go program."""
         # On Unix-like systems, need ./ prefix for local executables
-        if platform.system() != "Windows" and not prepared_file.startswith("./"):
+        if not _IS_WINDOWS and not os.path.dirname(prepared_file):
             return [f"./{prepared_file}"]
         return [prepared_file]
     
@@ -275,6 +310,8 @@ if __name__ == "__main__":
     # Register Go support
     register_custom_adapter(GoAdapter())
     
+    get_registry().flush_log()
+    
     print("\nCustom adapters registered successfully!")
     print("\nYou can now use these languages with the benchmark tool:")
     print("  python tests/diagnosetool.py --rust my_program.rs --cpp other.cpp --config input.txt")
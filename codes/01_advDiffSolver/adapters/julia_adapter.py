@@ -5,9 +5,9 @@ Handles execution of Julia programs.
 """
 
 import os
-import shutil
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from .base_adapter import LanguageAdapter
+from .adapter_helpers import find_executable
 from .config_parser import parse_compiler_config
 
 
@@ -21,6 +21,8 @@ class JuliaAdapter(LanguageAdapter):
         self.requires_compilation = False
         self.display_name = "Julia"
         self.emoji = "🔬"
+        # Flags are read at construction, before any prepare()/warmup() can
+        # overwrite config.txt/input.txt in the working directory
         self._custom_flags = self._load_flags(config_file)
     
     def _load_flags(self, config_file: str) -> List[str]:
@@ -42,11 +44,15 @@ class JuliaAdapter(LanguageAdapter):
         Returns:
             Tuple of (success, source_file, error_message)
         """
-        if not shutil.which("julia"):
+        if not find_executable("julia"):
             return False, "", "Julia interpreter not found. Please install Julia."
         
         return True, source_file, ""
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the Julia interpreter."""
+        return ["julia"] if find_executable("julia") else None
+    
     def get_execution_command(self, prepared_file: str) -> List[str]:
         """
         Get the command to execute a Julia program.
@@ -4,14 +4,22 @@ Python Language Adapter
 Handles execution of Python programs.
 """
 
+import contextlib
+import io
+import os
+import runpy
 import sys
-from typing import List, Tuple
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
 from .base_adapter import LanguageAdapter
 
 
 class PythonAdapter(LanguageAdapter):
     """Adapter for Python programs."""
     
+    # Shared instance, see instance()
+    _instance: Optional["PythonAdapter"] = None
+    
     def __init__(self):
         super().__init__()
         self.name = "python"
@@ -19,6 +27,23 @@ class PythonAdapter(LanguageAdapter):
         self.requires_compilation = False
         self.display_name = "Python"
         self.emoji = "🐍"
+        # Run programs inside the benchmark process (no interpreter startup in the timings)
+        self.in_process = False
+    
+    @classmethod
+    def instance(cls) -> "PythonAdapter":
+        """
+        Get the shared Python adapter, created on first use.
+        
+        The adapter has no per-program state, so registries share one instance.
+        Settings such as in_process then apply to all of them.
+        
+        Returns:
+            The shared PythonAdapter instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
     def prepare(self, source_file: str) -> Tuple[bool, str, str]:
         """
@@ -44,6 +69,80 @@ class PythonAdapter(LanguageAdapter):
         """
         return [sys.executable, prepared_file]
     
+    def get_tool_command(self) -> Optional[List[str]]:
+        """Get the command of the Python interpreter."""
+        return [sys.executable]
+    
+    def _run_in_process(self, prepared_file: str) -> None:
+        """
+        Run a Python program as __main__ inside the current interpreter.
+        
+        Args:
+            prepared_file: Path to the Python source file
+        """
+        argv, path0 = sys.argv, sys.path[0]
+        sys.argv = [prepared_file]
+        sys.path[0] = os.path.dirname(os.path.abspath(prepared_file))
+        try:
+            # Discard the program output like the subprocess pipe does
+            with contextlib.redirect_stdout(io.StringIO()):
+                runpy.run_path(prepared_file, run_name="__main__")
+        finally:
+            sys.argv, sys.path[0] = argv, path0
+    
+    def execute(self, prepared_file: str, config_content: str, 
+                config_files: Optional[Sequence[str]] = None,
+                cwd: Optional[str] = None) -> Dict:
+        """
+        Execute the program, in-process if enabled, otherwise in a subprocess.
+        
+        Args:
+            prepared_file: Path to the Python source file
+            config_content: Content to write to config file
+            config_files: Config file names to write to (default: config.txt and input.txt)
+            cwd: Directory to run the program in (subprocess mode only)
+            
+        Returns:
+            Dictionary with runtime, total_time, compilation_time and runtime_ns
+        """
+        if not self.in_process:
+            return super().execute(prepared_file, config_content, config_files, cwd)
+        if cwd is not None:
+            raise ValueError("In-process execution only runs in the current directory")
+        if self.config_mode == "stdin":
+            raise ValueError("In-process execution reads the configuration from files")
+        
+        self._write_config_files(config_content.encode("utf-8"), config_files)
+        
+        start = time.perf_counter_ns()
+        try:
+            self._run_in_process(prepared_file)
+        except SystemExit:
+            pass
+        return self._make_metrics(self.elapsed_ns(start, time.perf_counter_ns()))
+    
+    def warmup(self, prepared_file: str) -> bool:
+        """
+        Perform a warm-up run; in-process this also imports the program's modules.
+        
+        Args:
+            prepared_file: Path to the Python source file
+            
+        Returns:
+            True if warm-up successful, False otherwise
+        """
+        if not self.in_process:
+            return super().warmup(prepared_file)
+        
+        self._write_config_files(self._WARMUP_CONFIG)
+        try:
+            self._run_in_process(prepared_file)
+        except (Exception, SystemExit):
+            # The warm-up input is not a valid configuration; imports are done by now
+            pass
+        print(f"  {self.display_name} warm-up complete")
+        return True
+    
     def cleanup(self, prepared_file: str) -> None:
         """
         Python doesn't create temporary files during execution.
@@ -6,12 +6,21 @@ This enables a plug-and-play architecture for adding new languages.
 """
 
 import os
-from typing import Dict, List, Optional, Type
+import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Type
 from .base_adapter import LanguageAdapter
+from .adapter_helpers import find_executable
 from .python_adapter import PythonAdapter
 from .cpp_adapter import CppAdapter
 from .julia_adapter import JuliaAdapter
 
+# Emojis (supplementary symbol planes), removed when the console cannot encode them
+_EMOJI_WIDE_RE = re.compile(r'[\U0001F000-\U0001FFFF]+')
+
 
 class LanguageRegistry:
     """
@@ -28,12 +37,16 @@ class LanguageRegistry:
         self._adapters_by_name: Dict[str, LanguageAdapter] = {}
         self._adapters_by_extension: Dict[str, LanguageAdapter] = {}
         self._config_file = config_file
+        # get_language_info() result, rebuilt after each registration
+        self._language_info: Optional[List[Dict[str, str]]] = None
+        # Registration messages, printed by flush_log() (only command-line tools do)
+        self._registration_log: List[str] = []
         self._register_builtin_adapters()
     
     def _register_builtin_adapters(self) -> None:
         """Register all built-in language adapters."""
         builtin_adapters = [
-            PythonAdapter(),
+            PythonAdapter.instance(),
             CppAdapter(config_file=self._config_file),
             JuliaAdapter(config_file=self._config_file),
         ]
@@ -48,24 +61,42 @@ class LanguageRegistry:
         Args:
             adapter: The language adapter to register
         """
-        # Register by language name
-        self._adapters_by_name[adapter.name.lower()] = adapter
+        # Tools may have been installed since the last lookup
+        find_executable.cache_clear()
+        self._language_info = None
+        
+        # Register by language name (interned, like the extensions below)
+        self._adapters_by_name[sys.intern(adapter.name.lower())] = adapter
         
         # Register by file extensions
         for ext in adapter.extensions:
             # Normalize extension (ensure it starts with a dot)
             normalized_ext = ext if ext.startswith('.') else f'.{ext}'
-            self._adapters_by_extension[normalized_ext.lower()] = adapter
+            self._adapters_by_extension[sys.intern(normalized_ext.lower())] = adapter
         
-        # Safe printing for Windows - use simple print, safe_print in utils handles it
-        message = f"Registered adapter: {adapter.display_name} ({', '.join(adapter.extensions)})"
-        try:
-            print(message)
-        except (UnicodeEncodeError, UnicodeError):
-            # Fallback: print without emojis
-            import re
-            message_safe = re.sub(r'[\U0001F000-\U0001FFFF]+', '', message)
-            print(message_safe.strip())
+        self._registration_log.append(
+            f"Registered adapter: {adapter.display_name} ({', '.join(adapter.extensions)})"
+        )
+    
+    def flush_log(self, printer: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Print the registration messages collected since the last call, then clear them.
+        
+        Args:
+            printer: Function printing one message (default: print, without
+                     emojis if the console cannot encode them)
+        """
+        messages, self._registration_log = self._registration_log, []
+        for message in messages:
+            if printer is not None:
+                printer(message)
+                continue
+            try:
+                print(message)
+            except (UnicodeEncodeError, UnicodeError):
+                # Fallback: print without emojis
+                message_safe = _EMOJI_WIDE_RE.sub('', message)
+                print(message_safe.strip())
     
     def get_adapter_by_name(self, language_name: str) -> Optional[LanguageAdapter]:
         """
@@ -77,7 +108,8 @@ class LanguageRegistry:
         Returns:
             The language adapter, or None if not found
         """
-        return self._adapters_by_name.get(language_name.lower())
+        # Keys are lower case; names passed around (e.g. adapter.name) usually already are
+        return self._adapters_by_name.get(language_name if language_name.islower() else language_name.lower())
     
     def get_adapter_by_file(self, filename: str) -> Optional[LanguageAdapter]:
         """
@@ -89,8 +121,9 @@ class LanguageRegistry:
         Returns:
             The language adapter, or None if extension not recognized
         """
-        _, ext = os.path.splitext(filename)
-        return self._adapters_by_extension.get(ext.lower())
+        ext = os.path.splitext(filename)[1]
+        # Keys are lower case; most file names already are, so skip the copy
+        return self._adapters_by_extension.get(ext if ext.islower() else ext.lower())
     
     def detect_language(self, filename: str) -> Optional[str]:
         """
@@ -130,16 +163,18 @@ class LanguageRegistry:
         Returns:
             List of dictionaries with language information
         """
-        info = []
-        for adapter in self._adapters_by_name.values():
-            info.append({
-                'name': adapter.name,
-                'display_name': adapter.display_name,
-                'emoji': adapter.emoji,
-                'extensions': ', '.join(adapter.extensions),
-                'requires_compilation': str(adapter.requires_compilation)
-            })
-        return info
+        if self._language_info is None:
+            self._language_info = [
+                {
+                    'name': adapter.name,
+                    'display_name': adapter.display_name,
+                    'emoji': adapter.emoji,
+                    'extensions': ', '.join(adapter.extensions),
+                    'requires_compilation': str(adapter.requires_compilation)
+                }
+                for adapter in self._adapters_by_name.values()
+            ]
+        return list(self._language_info)
     
     def __repr__(self) -> str:
         languages = ', '.join(self.get_supported_languages())
@@ -148,19 +183,54 @@ class LanguageRegistry:
 
 # Global registry instance
 _global_registry: Optional[LanguageRegistry] = None
+_global_registry_lock = threading.Lock()
 
 
 def get_registry(config_file: str = None) -> LanguageRegistry:
     """
     Get the global language registry instance.
     
+    The first call creates the registry (with its config_file); the lock only
+    guards that creation, later calls return the instance without locking.
+    
     Returns:
         The global LanguageRegistry instance
     """
     global _global_registry
-    if _global_registry is None:
-        _global_registry = LanguageRegistry(config_file=config_file)
-    return _global_registry
+    registry = _global_registry
+    if registry is None:
+        with _global_registry_lock:
+            if _global_registry is None:
+                _global_registry = LanguageRegistry(config_file=config_file)
+            registry = _global_registry
+    return registry
+
+
+def prewarm_interpreters(adapters: Iterable[LanguageAdapter]) -> None:
+    """
+    Start the interpreters and compilers of the given adapters once, in parallel.
+    
+    Running each tool with --version loads its executable and shared libraries
+    into the OS caches, so the first measured run does not pay for it.
+    Failures are ignored, the tools are checked again in prepare().
+    
+    Args:
+        adapters: Language adapters whose tools should be pre-warmed
+    """
+    commands = {}
+    for adapter in adapters:
+        cmd = adapter.get_tool_command()
+        if cmd:
+            commands[adapter.name] = cmd + ["--version"]
+    
+    def run(cmd):
+        try:
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            pass
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(run, commands.values()))
 
 
 def register_custom_adapter(adapter: LanguageAdapter) -> None:
@@ -1,23 +1,22 @@
 import streamlit as st
 import os
 import tempfile
-import json
-import shutil
+import orjson
 
 # Import utility functions
-from utils.file_utils import detect_language
+from utils.file_utils import detect_language, find_result_artifacts
 from utils.session_utils import init_session_state
-from utils.benchmark_utils import run_benchmark
+from utils.benchmark_utils import run_benchmark, compute_benchmark_key, parse_progress_line
 from utils.results_utils import calculate_summary_metrics
-from utils.ui_utils import load_custom_css, get_language_emoji
+from utils.ui_utils import load_custom_css, section_header, get_language_emoji
+from utils.cache_utils import (
+    results_key, cached_loglog_chart, cached_loglog_chart_total,
+    cached_difference_chart, cached_bar_chart, png_bytes, cached_results_table,
+    cached_csv_text, cached_download_package
+)
 
 # Import plot and table creation functions
-from scripts.create_bar_chart import create_bar_chart
-from scripts.create_loglog_chart import create_loglog_chart, create_loglog_chart_total
-from scripts.create_difference_chart import create_difference_chart
-from scripts.create_results_table import create_results_table
-from scripts.create_csv_data import create_csv_data
-from scripts.create_download_package import create_download_package
+from scripts.create_results_table import style_results_table
 
 # Page configuration
 st.set_page_config(
@@ -43,7 +42,7 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # File Upload Section
-st.markdown('<div class="section-header">📁 Upload Files</div>', unsafe_allow_html=True)
+section_header('📁 Upload Files')
 
 col1, col2, col3 = st.columns(3)
 
@@ -51,56 +50,67 @@ with col1:
     st.markdown("**Program 1 (.py/.cpp/.jl)**")
     uploaded_prog1_file = st.file_uploader("Upload first program", type=['py', 'cpp', 'cc', 'cxx', 'jl'], key="prog1_upload")
     if uploaded_prog1_file is not None:
-        st.session_state.program1_code = uploaded_prog1_file.read().decode('utf-8')
-        st.session_state.program1_filename = uploaded_prog1_file.name
-        st.session_state.program1_language = detect_language(uploaded_prog1_file.name)
+        # Only read when a new file was uploaded, not on every rerun (kept as bytes)
+        if uploaded_prog1_file.file_id != st.session_state.get('_prog1_upload_id'):
+            st.session_state.program1_code = uploaded_prog1_file.getvalue()
+            st.session_state.program1_filename = uploaded_prog1_file.name
+            st.session_state.program1_language = detect_language(uploaded_prog1_file.name)
+            st.session_state._prog1_upload_id = uploaded_prog1_file.file_id
     elif uploaded_prog1_file is None and 'program1_code' in st.session_state:
         # Clear session state when file is removed
         del st.session_state.program1_code
         del st.session_state.program1_filename
         del st.session_state.program1_language
+        st.session_state.pop('_prog1_upload_id', None)
 
 with col2:
     st.markdown("**Program 2 (.py/.cpp/.jl)**")
     uploaded_prog2_file = st.file_uploader("Upload second program", type=['py', 'cpp', 'cc', 'cxx', 'jl'], key="prog2_upload")
     if uploaded_prog2_file is not None:
-        st.session_state.program2_code = uploaded_prog2_file.read().decode('utf-8')
-        st.session_state.program2_filename = uploaded_prog2_file.name
-        st.session_state.program2_language = detect_language(uploaded_prog2_file.name)
+        # Only read when a new file was uploaded, not on every rerun (kept as bytes)
+        if uploaded_prog2_file.file_id != st.session_state.get('_prog2_upload_id'):
+            st.session_state.program2_code = uploaded_prog2_file.getvalue()
+            st.session_state.program2_filename = uploaded_prog2_file.name
+            st.session_state.program2_language = detect_language(uploaded_prog2_file.name)
+            st.session_state._prog2_upload_id = uploaded_prog2_file.file_id
     elif uploaded_prog2_file is None and 'program2_code' in st.session_state:
         # Clear session state when file is removed
         del st.session_state.program2_code
         del st.session_state.program2_filename
         del st.session_state.program2_language
+        st.session_state.pop('_prog2_upload_id', None)
 
 with col3:
     st.markdown("**Configuration File**")
     uploaded_config_file = st.file_uploader("Upload config file", type=['txt', 'cfg', 'json', 'yaml', 'yml', 'ini'], key="config_upload")
     if uploaded_config_file is not None:
-        st.session_state.config_content = uploaded_config_file.read().decode('utf-8')
-        st.session_state.config_filename = uploaded_config_file.name
+        # Only read when a new file was uploaded, not on every rerun (kept as bytes)
+        if uploaded_config_file.file_id != st.session_state.get('_config_upload_id'):
+            st.session_state.config_content = uploaded_config_file.getvalue()
+            st.session_state.config_filename = uploaded_config_file.name
+            st.session_state._config_upload_id = uploaded_config_file.file_id
     elif uploaded_config_file is None and 'config_content' in st.session_state:
         # Clear session state when file is removed
         del st.session_state.config_content
         del st.session_state.config_filename
+        st.session_state.pop('_config_upload_id', None)
 
 # Benchmark execution
-st.markdown('<div class="section-header">Run Benchmark</div>', unsafe_allow_html=True)
+section_header('Run Benchmark')
 
-# Check if everything is ready
-files_provided = bool(
-    st.session_state.get('program1_code') and 
-    st.session_state.get('program2_code') and 
-    st.session_state.get('config_content')
-)
+# Check if everything is ready (uploads read from the session state once per rerun)
+program1_code = st.session_state.get('program1_code')
+program2_code = st.session_state.get('program2_code')
+config_content = st.session_state.get('config_content')
+files_provided = bool(program1_code and program2_code and config_content)
 
 if not files_provided:
     missing_items = []
-    if not st.session_state.get('program1_code'):
+    if not program1_code:
         missing_items.append("Program 1")
-    if not st.session_state.get('program2_code'):
+    if not program2_code:
         missing_items.append("Program 2")
-    if not st.session_state.get('config_content'):
+    if not config_content:
         missing_items.append("Config file")
     
     st.warning(f"⚠️ Please upload: {', '.join(missing_items)}")
@@ -134,73 +144,92 @@ if delete_db_button:
         st.info("ℹ️ No database file found to delete.")
 
 if run_button and files_provided:
-    with st.spinner("Running benchmark... This may take a few minutes."):
-        # Create temporary files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Write program files
-            prog1_filename = st.session_state.get('program1_filename', 'program1.py')
-            prog2_filename = st.session_state.get('program2_filename', 'program2.py')
-            config_filename = st.session_state.get('config_filename', 'config.txt')
-            
-            prog1_file = os.path.join(temp_dir, prog1_filename)
-            prog2_file = os.path.join(temp_dir, prog2_filename)
-            config_file = os.path.join(temp_dir, config_filename)
-            
-            with open(prog1_file, 'w', encoding='utf-8') as f:
-                f.write(st.session_state.program1_code)
-            
-            with open(prog2_file, 'w', encoding='utf-8') as f:
-                f.write(st.session_state.program2_code)
-            
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write(st.session_state.config_content)
-            
-            # Change to temp directory and run benchmark
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
+    # Skip the run entirely when neither the uploads nor the database changed since the last one
+    all_metrics_path = os.path.join('results', 'all_metrics.json')
+    benchmark_key = (
+        compute_benchmark_key(
+            program1_code,
+            st.session_state.program1_language,
+            program2_code,
+            st.session_state.program2_language,
+            config_content
+        ),
+        os.path.getmtime(all_metrics_path) if os.path.exists(all_metrics_path) else None
+    )
+    
+    if st.session_state.benchmark_results and st.session_state.benchmark_key == benchmark_key:
+        st.info("ℹ️ Inputs unchanged since the last run, showing the previous results.")
+    else:
+        with st.spinner("Running benchmark... This may take a few minutes."):
+            # Create temporary files
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # Write program files (the uploaded bytes, unchanged)
+                prog1_filename = st.session_state.get('program1_filename', 'program1.py')
+                prog2_filename = st.session_state.get('program2_filename', 'program2.py')
+                config_filename = st.session_state.get('config_filename', 'config.txt')
                 
-                # Copy diagnosetool.py
-                shutil.copy(os.path.join(original_cwd, 'scripts', 'diagnosetool.py'), '.')
+                prog1_file = os.path.join(temp_dir, prog1_filename)
+                prog2_file = os.path.join(temp_dir, prog2_filename)
+                config_file = os.path.join(temp_dir, config_filename)
                 
-                # Copy utils and adapters directories (needed by diagnosetool.py)
-                shutil.copytree(os.path.join(original_cwd, 'utils'), 'utils')
-                shutil.copytree(os.path.join(original_cwd, 'adapters'), 'adapters')
-
-                # Copy existing results if available (to avoid re-running already measured configs)
-                existing_results_path = os.path.join(original_cwd, 'results', 'all_metrics.json')
-                if os.path.exists(existing_results_path):
-                    os.makedirs('results', exist_ok=True)
-                    shutil.copy(existing_results_path, 'results/all_metrics.json')
+                with open(prog1_file, 'wb') as f:
+                    f.write(program1_code)
+                
+                with open(prog2_file, 'wb') as f:
+                    f.write(program2_code)
                 
+                with open(config_file, 'wb') as f:
+                    f.write(config_content)
+                
+                # Live progress from the benchmark output
+                progress_bar = st.progress(0.0, text="Preparing programs...")
+                output_line = st.empty()
+                block_count = [0]
+                
+                def show_progress(line):
+                    output_line.text(line.rstrip())
+                    progress = parse_progress_line(line)
+                    if progress is None:
+                        return
+                    kind, value = progress
+                    if kind == 'total':
+                        block_count[0] = value
+                    elif block_count[0]:
+                        progress_bar.progress(
+                            (value - 1) / block_count[0],
+                            text=f"Configuration block {value} of {block_count[0]}"
+                        )
+                
+                # Run the benchmark in the temp directory (diagnosetool.py is invoked in place)
                 success, results = run_benchmark(
                     prog1_filename, 
                     st.session_state.program1_language,
                     prog2_filename, 
                     st.session_state.program2_language,
-                    config_filename
+                    config_filename,
+                    on_output=show_progress,
+                    # Measured configs are read from and added to the app's database in place
+                    output_dir=os.path.abspath('results'),
+                    cwd=temp_dir
                 )
                 
-                # Copy results back
-                if success and os.path.exists('results'):
-                    if os.path.exists(os.path.join(original_cwd, 'results')):
-                        shutil.rmtree(os.path.join(original_cwd, 'results'))
-                    shutil.copytree('results', os.path.join(original_cwd, 'results'))
-                
-            finally:
-                os.chdir(original_cwd)
-            
-            if success:
-                st.session_state.benchmark_results = results
-                st.success("✅ Benchmark completed successfully!")
-                # Force rerun to update GIF display
-                st.rerun()
-            else:
-                st.error(f"❌ Benchmark failed: {results}")
+                if success:
+                    st.session_state.benchmark_results = results
+                    st.session_state.result_artifacts = None
+                    st.session_state.zip_ready = False
+                    st.session_state.benchmark_key = (
+                        benchmark_key[0],
+                        os.path.getmtime(all_metrics_path) if os.path.exists(all_metrics_path) else None
+                    )
+                    st.success("✅ Benchmark completed successfully!")
+                    # Force rerun to update GIF display
+                    st.rerun()
+                else:
+                    st.error(f"❌ Benchmark failed: {results}")
 
 # Results section
 if st.session_state.benchmark_results:
-    st.markdown('<div class="section-header">📊 Results</div>', unsafe_allow_html=True)
+    section_header('📊 Results')
     
     results = st.session_state.benchmark_results
     lang1 = results['languages']['program1']
@@ -234,90 +263,97 @@ if st.session_state.benchmark_results:
             with col3:
                 st.metric("Avg Total Speedup", f"{metrics['avg_total_speedup']:.2f}x")
     
-    # Performance plots
-    line_chart_path = create_loglog_chart(results)
-    line_chart_total_path = create_loglog_chart_total(results)
-    diff_chart_path = create_difference_chart()
-    bar_fig = create_bar_chart(results)
+    # Performance plots (cached, only rebuilt when the results change)
+    results_json = results_key(results)
+    line_chart_png = cached_loglog_chart(results_json)
+    line_chart_total_png = cached_loglog_chart_total(results_json)
+    diff_chart_png = cached_difference_chart(os.path.join('results', 'all_metrics.json'))
+    bar_fig = cached_bar_chart(results_json)
     
-    if line_chart_path and os.path.exists(line_chart_path):
+    if line_chart_png:
         st.markdown("### 📈 Runtime Comparison (Log-Log)")
-        st.image(line_chart_path, use_container_width=True, 
+        st.image(line_chart_png, use_container_width=True, 
                 caption="Runtime only (compilation excluded) - logarithmic scales on both axes")
 
-    if line_chart_total_path and os.path.exists(line_chart_total_path):
+    if line_chart_total_png:
         st.markdown("### 📈 Total Time Comparison (Log-Log)")
-        st.image(line_chart_total_path, use_container_width=True, 
+        st.image(line_chart_total_png, use_container_width=True, 
                 caption="Total time including compilation - logarithmic scales on both axes")
 
-    if diff_chart_path and os.path.exists(diff_chart_path):
+    if diff_chart_png:
         st.markdown("### 📉 Runtime Difference Chart")
-        st.image(diff_chart_path, use_container_width=True, 
+        st.image(diff_chart_png, use_container_width=True, 
                 caption="Relative Difference in runtime between the two programs - logarithmic scale on X axis")
 
     if bar_fig:
         st.markdown("### 📊 Runtime Comparison (Bar Chart)")
         st.plotly_chart(bar_fig, use_container_width=True)
     
-    # Look for generated PNG files in results directory
-    results_dir = "results"
-    if os.path.exists(results_dir):
-        # Performance comparison plot
-        perf_comp_path = os.path.join(results_dir, "performance_comparison.png")
-        if os.path.exists(perf_comp_path):
-            st.markdown("**Performance Comparison Overview**")
-            st.image(perf_comp_path, caption="Comprehensive performance comparison generated by diagnosetool.py", use_container_width=True)
-        
-        # Runtime plot (always single plot)
-        runtime_plot_path = os.path.join(results_dir, "runtime_by_input.png")
-        if os.path.exists(runtime_plot_path):
-            st.markdown("**Runtime by Input Size**")
-            st.image(runtime_plot_path, caption="Runtime comparison across different input sizes", use_container_width=True)
+    # Look for generated PNG files in results directory (once per benchmark run, not on every rerun)
+    if st.session_state.get('result_artifacts') is None:
+        st.session_state.result_artifacts = find_result_artifacts("results")
+    artifacts = st.session_state.result_artifacts
+    
+    # Performance comparison plot
+    perf_comp_png = png_bytes(artifacts['performance_comparison']) if artifacts['performance_comparison'] else None
+    if perf_comp_png:
+        st.markdown("**Performance Comparison Overview**")
+        st.image(perf_comp_png, caption="Comprehensive performance comparison generated by diagnosetool.py", use_container_width=True)
+    
+    # Runtime plot (always single plot)
+    runtime_plot_png = png_bytes(artifacts['runtime_by_input']) if artifacts['runtime_by_input'] else None
+    if runtime_plot_png:
+        st.markdown("**Runtime by Input Size**")
+        st.image(runtime_plot_png, caption="Runtime comparison across different input sizes", use_container_width=True)
     
     # Additional visualizations can be added here if needed
     st.markdown("---")
     
-    # Detailed results table
+    # Detailed results table (numeric, formatted for display only)
     if 'test_cases' in results:
         st.subheader("📋 Detailed Results")
         
-        df = create_results_table(results)
+        df = cached_results_table(results_json)
         if df is not None:
-            st.dataframe(df, use_container_width=True)
+            st.dataframe(style_results_table(df), use_container_width=True)
     
     # Download section
     st.subheader("💾 Download Results")
     
+    # The exports are cached like the charts, so reruns do not rebuild them
+    csv_text = cached_csv_text(results_json)
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         st.download_button(
             label="📄 Download JSON",
-            data=json.dumps(results, indent=2),
+            data=orjson.dumps(results, option=orjson.OPT_INDENT_2),
             file_name="benchmark_results.json",
             mime="application/json"
         )
     
     with col2:
-        if 'test_cases' in results:
-            csv_data = create_csv_data(results)
-            
-            if csv_data is not None:
-                st.download_button(
-                    label="📊 Download CSV",
-                    data=csv_data.to_csv(index=False),
-                    file_name="benchmark_results.csv",
-                    mime="text/csv"
-                )
+        if csv_text is not None:
+            st.download_button(
+                label="📊 Download CSV",
+                data=csv_text,
+                file_name="benchmark_results.csv",
+                mime="text/csv"
+            )
     
     with col3:
-        zip_package = create_download_package(results)
-        st.download_button(
-            label="📦 Download All",
-            data=zip_package.getvalue(),
-            file_name="benchmark_results.zip",
-            mime="application/zip"
-        )
+        # The archive is only built once asked for, most reruns never download it
+        if st.session_state.get('zip_ready'):
+            st.download_button(
+                label="📦 Download All",
+                data=cached_download_package(results_json),
+                file_name="benchmark_results.zip",
+                mime="application/zip"
+            )
+        elif st.button("📦 Prepare ZIP"):
+            st.session_state.zip_ready = True
+            st.rerun()
 
 # Footer
 st.markdown("---")
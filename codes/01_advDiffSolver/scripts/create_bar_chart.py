@@ -11,14 +11,9 @@ def create_bar_chart(results):
     lang2 = results['languages']['program2']
     
     # Prepare data
-    case_names = []
-    prog1_times = []
-    prog2_times = []
-    
-    for i, (case_name, case_data) in enumerate(test_cases.items()):
-        case_names.append(case_name)
-        prog1_times.append(case_data['program1']['runtime'])
-        prog2_times.append(case_data['program2']['runtime'])
+    case_names = list(test_cases)
+    prog1_times = [case_data['program1']['runtime'] for case_data in test_cases.values()]
+    prog2_times = [case_data['program2']['runtime'] for case_data in test_cases.values()]
     
     # Create Bar Chart for runtime comparison
     bar_fig = go.Figure()
@@ -1,22 +1,22 @@
-import pandas as pd
+from scripts.create_results_table import create_results_table
 
 
-def create_csv_data(results):
-    """Create CSV data for download"""
+def create_csv_data(results, table=None):
+    """Create CSV data for download, reusing the results table when given"""
     if not results or 'test_cases' not in results:
         return None
     
+    if table is None:
+        table = create_results_table(results)
+    
     lang1 = results['languages']['program1']
     lang2 = results['languages']['program2']
     
-    csv_data = pd.DataFrame([
-        {
-            'Test Case': case_name,
-            f'{lang1.title()} Runtime (s)': case_data['program1']['runtime'],
-            f'{lang2.title()} Runtime (s)': case_data['program2']['runtime'],
-            'Speedup Factor': case_data['program1']['runtime'] / case_data['program2']['runtime'] if case_data['program2']['runtime'] > 0 else 0
-        }
-        for case_name, case_data in results['test_cases'].items()
-    ])
+    csv_data = table[[
+        'Test Case',
+        f'{lang1.title()} Runtime (s)',
+        f'{lang2.title()} Runtime (s)',
+        'Runtime Speedup'
+    ]].rename(columns={'Runtime Speedup': 'Speedup Factor'})
     
     return csv_data
@@ -1,13 +1,15 @@
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG files, no GUI backend detection
 import matplotlib.pyplot as plt
 import numpy as np
 import os
-import json
 import tempfile
+import orjson
 
 
 def load_metrics_from_json(json_path):
-    with open(json_path, 'r') as f:
-        return json.load(f)
+    with open(json_path, 'rb') as f:
+        return orjson.loads(f.read())
     
 
 def create_difference_chart(json_path=None):
@@ -51,7 +53,7 @@ def create_difference_chart(json_path=None):
     relative_differences = np.array(relative_differences)
     #time_differences = np.array(time_differences)
     
-    plt.figure("runtime_difference", figsize=(10, 6))
+    fig = plt.figure("runtime_difference", figsize=(10, 6))
     plt.plot(nX, relative_differences, "o-", linewidth=2, markersize=8, 
              label=f"Relative Differenz")
     plt.axhline(y=0, color='gray', linestyle='--', linewidth=1)
@@ -65,8 +67,8 @@ def create_difference_chart(json_path=None):
     plt.tight_layout()
     
     diff_chart_path = os.path.join(tempfile.gettempdir(), 'difference_chart_runtime.png')
-    plt.savefig(diff_chart_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(diff_chart_path, dpi=150)
+    plt.close(fig)
     
     return diff_chart_path
 
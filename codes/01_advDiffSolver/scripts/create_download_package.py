@@ -1,41 +1,33 @@
 import zipfile
 import io
-import json
-import pandas as pd
+import tempfile
+import orjson
 import os
 
+from scripts.create_csv_data import create_csv_data
 
-def create_download_package(results):
-    """Create a downloadable package with all results"""
-    zip_buffer = io.BytesIO()
+
+def create_download_package(results, csv_data=None):
+    """Create a downloadable package with all results and return the path of the zip file"""
+    # Build the archive on disk rather than in memory; the caller removes it when done
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp:
+        zip_path = tmp.name
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    # Fastest deflate level: results are small text files, level 1 already shrinks them well
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
         # Add JSON results
-        zip_file.writestr('results.json', json.dumps(results, indent=2))
+        zip_file.writestr('results.json', orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
         # Add CSV results
-        if 'test_cases' in results:
-            lang1 = results['languages']['program1']
-            lang2 = results['languages']['program2']
-            
-            df_data = []
-            for case_name, case_data in results['test_cases'].items():
-                speedup = case_data['program1']['runtime'] / case_data['program2']['runtime'] if case_data['program2']['runtime'] > 0 else 0
-                df_data.append({
-                    'Test Case': case_name,
-                    f'{lang1.title()} Runtime (s)': case_data['program1']['runtime'],
-                    f'{lang2.title()} Runtime (s)': case_data['program2']['runtime'],
-                    'Speedup Factor': speedup
-                })
-            
-            df = pd.DataFrame(df_data)
-            csv_buffer = io.StringIO()
-            df.to_csv(csv_buffer, index=False)
-            zip_file.writestr('results.csv', csv_buffer.getvalue())
+        if csv_data is None:
+            csv_data = create_csv_data(results)
+        if csv_data is not None:
+            with zip_file.open('results.csv', 'w') as zf, io.TextIOWrapper(zf, 'utf-8', newline='') as tf:
+                csv_data.to_csv(tf, index=False)
         
-        # Add plot images if they exist
+        # Add plot images if they exist (PNGs are already compressed)
         if os.path.exists('results/runtime_comparison.png'):
-            zip_file.write('results/runtime_comparison.png', 'runtime_comparison.png')
+            zip_file.write('results/runtime_comparison.png', 'runtime_comparison.png',
+                           compress_type=zipfile.ZIP_STORED)
     
-    zip_buffer.seek(0)
-    return zip_buffer
+    return zip_path
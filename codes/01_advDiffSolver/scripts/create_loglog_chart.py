@@ -1,3 +1,5 @@
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG files, no GUI backend detection
 import matplotlib.pyplot as plt
 import numpy as np
 import os
@@ -17,7 +19,7 @@ def create_loglog_chart(results):
     timeLang1 = [case_data['program1']['runtime'] for case_data in test_cases.values()]
     timeLang2 = [case_data['program2']['runtime'] for case_data in test_cases.values()]
     
-    plt.figure("runtime")
+    fig = plt.figure("runtime")
     plt.loglog(nX, timeLang1, "o-", label=lang1.title())
     plt.loglog(nX, timeLang2, "s-", label=lang2.title())
     plt.loglog(nX, 1e-5*nX**2, "--", c="black", label="O(n²)")
@@ -35,8 +37,8 @@ def create_loglog_chart(results):
     plt.tight_layout()
     
     line_chart_path = os.path.join(tempfile.gettempdir(), 'line_chart_loglog_runtime.png')
-    plt.savefig(line_chart_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(line_chart_path, dpi=150)
+    plt.close(fig)
     
     return line_chart_path
 
@@ -56,7 +58,7 @@ def create_loglog_chart_total(results):
     timeLang2 = [case_data['program2'].get('total_time', case_data['program2']['runtime']) 
                  for case_data in test_cases.values()]
     
-    plt.figure("total_time")
+    fig = plt.figure("total_time")
     plt.loglog(nX, timeLang1, "o-", label=lang1.title())
     plt.loglog(nX, timeLang2, "s-", label=lang2.title())
     plt.loglog(nX, 1e-5*nX**2, "--", c="black", label="O(n²)")
@@ -74,7 +76,7 @@ def create_loglog_chart_total(results):
     plt.tight_layout()
     
     line_chart_path = os.path.join(tempfile.gettempdir(), 'line_chart_loglog_total.png')
-    plt.savefig(line_chart_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(line_chart_path, dpi=150)
+    plt.close(fig)
     
     return line_chart_path
@@ -10,21 +10,28 @@ def create_results_table(results):
     
     table_data = []
     for case_name, case_data in results['test_cases'].items():
-        runtime_speedup = case_data['program1']['runtime'] / case_data['program2']['runtime'] if case_data['program2']['runtime'] > 0 else 0
-        
-        prog1_total = case_data['program1'].get('total_time', case_data['program1']['runtime'])
-        prog2_total = case_data['program2'].get('total_time', case_data['program2']['runtime'])
-        total_speedup = prog1_total / prog2_total if prog2_total > 0 else 0
-        
         table_data.append({
             'Test Case': case_name,
-            f'{lang1.title()} Runtime (s)': f"{case_data['program1']['runtime']:.4f}",
-            f'{lang2.title()} Runtime (s)': f"{case_data['program2']['runtime']:.4f}",
-            'Runtime Speedup': f"{runtime_speedup:.2f}x" if runtime_speedup > 0 else 'N/A',
-            f'{lang1.title()} Total (s)': f"{prog1_total:.4f}",
-            f'{lang2.title()} Total (s)': f"{prog2_total:.4f}",
-            'Total Speedup': f"{total_speedup:.2f}x" if total_speedup > 0 else 'N/A'
+            f'{lang1.title()} Runtime (s)': case_data['program1']['runtime'],
+            f'{lang2.title()} Runtime (s)': case_data['program2']['runtime'],
+            'Runtime Speedup': case_data['speedup'],
+            f'{lang1.title()} Total (s)': case_data['program1'].get('total_time', case_data['program1']['runtime']),
+            f'{lang2.title()} Total (s)': case_data['program2'].get('total_time', case_data['program2']['runtime']),
+            'Total Speedup': case_data['total_speedup']
         })
     
     df = pd.DataFrame(table_data)
     return df
+
+
+def _format_speedup(value):
+    return f"{value:.2f}x" if value > 0 else 'N/A'
+
+
+def style_results_table(df):
+    """Apply display formatting to the numeric results table"""
+    formats = {
+        column: '{:.4f}' if column.endswith('(s)') else _format_speedup
+        for column in df.columns if column != 'Test Case'
+    }
+    return df.style.format(formats)
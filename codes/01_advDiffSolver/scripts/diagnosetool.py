@@ -2,21 +2,31 @@
 # -*- coding: utf-8 -*-
 import argparse
 import os
+import re
 import sys
-import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 
-from adapters.registry import get_registry
+# Make the project packages importable, also when this script is run through a symlink
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from adapters.registry import get_registry, prewarm_interpreters
 from utils.console_utils import safe_print, configure_windows_console
 
 # Configure Windows console for UTF-8
 configure_windows_console()
 
+# Separator between parameter sets: a line that is empty or only holds whitespace
+_BLANK_LINE_RE = re.compile(r"\n[ \t\r\f\v]*\n")
+
+
 def read_config_blocks(filename):
     with open(filename, "r") as f:
         content = f.read()
     
-    # Split by double newline to support multiple parameter sets
-    blocks = content.strip().split("\n\n")
+    # Split at blank lines (also whitespace-only ones) to support multiple parameter sets
+    blocks = _BLANK_LINE_RE.split(content.strip())
     
     # Filter each block to remove comment lines and compiler config lines
     filtered_blocks = []
@@ -35,6 +45,53 @@ def read_config_blocks(filename):
     
     return filtered_blocks
 
+def print_metrics(adapter, metrics):
+    print(f"{adapter.display_name} runtime: {metrics['runtime']:.4f}s")
+    if 'compilation_time' in metrics and metrics['compilation_time'] > 0:
+        print(f"{adapter.display_name} compilation time: {metrics['compilation_time']:.4f}s")
+    print(f"{adapter.display_name} total time: {metrics.get('total_time', metrics['runtime']):.4f}s")
+
+def print_speedup(programs, result_entry):
+    # Speedup of the first vs the second program
+    if len(programs) >= 2:
+        prog1_time = result_entry[programs[0]['type']]['runtime']
+        prog2_time = result_entry[programs[1]['type']]['runtime']
+        speedup = prog1_time / prog2_time if prog2_time > 0 else 0
+        print(f"\nSpeedup ({programs[0]['type']} vs {programs[1]['type']}): {speedup:.2f}x")
+
+def print_block_header(idx, config_block):
+    print(f"\n--- Configuration Block #{idx + 1} ---")
+    print(f"Config preview: {config_block[:100]}..." if len(config_block) > 100 else f"Config: {config_block}")
+
+def run_config_blocks_parallel(programs, blocks, jobs):
+    """Run configuration blocks concurrently, each in its own working directory.
+
+    Programs read and write fixed file names (config.txt, input.txt, outputs),
+    so every block gets a private directory and absolute program paths.
+    """
+    prepared_files = [os.path.abspath(prog['prepared_file']) for prog in programs]
+
+    def run_block(config_block):
+        with tempfile.TemporaryDirectory(prefix="codebench_block_") as cwd:
+            result_entry = {"config": config_block}
+            for prog, prepared_file in zip(programs, prepared_files):
+                result_entry[prog['type']] = prog['adapter'].execute(prepared_file, config_block, cwd=cwd)
+            return result_entry
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [(idx, config_block, pool.submit(run_block, config_block)) for idx, config_block in blocks]
+        # Report in configuration order
+        for idx, config_block, future in futures:
+            result_entry = future.result()
+            print_block_header(idx, config_block)
+            for prog in programs:
+                print()
+                print_metrics(prog['adapter'], result_entry[prog['type']])
+            print_speedup(programs, result_entry)
+            results.append(result_entry)
+    return results
+
 def main():
     parser = argparse.ArgumentParser(
         description="General-purpose benchmark tool for Python, C++, and Julia programs"
@@ -43,10 +100,32 @@ def main():
     parser.add_argument("--cpp", nargs='+', help="C++ source path(s)")
     parser.add_argument("--jl", nargs='+', help="Julia script path(s)")
     parser.add_argument("--config", required=True, help="Path to configuration file with parameter sets")
+    parser.add_argument("--output-dir", default="results",
+                        help="Directory holding the metrics database all_metrics.json (default: results)")
+    parser.add_argument("--cxxflags",
+                        help="C++ compiler flags, e.g. --cxxflags=\"-O2 -g\" (overrides the config file and defaults)")
+    parser.add_argument("--py-in-process", action="store_true",
+                        help="Run Python programs inside the benchmark process (excludes interpreter startup)")
+    parser.add_argument("--config-stdin", action="store_true",
+                        help="Pass each parameter set on the programs' standard input instead of config.txt/input.txt")
+    parser.add_argument("--pin-core", type=int,
+                        help="Pin the measured programs to this CPU core (Linux only), e.g. --pin-core 1")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of configuration blocks measured concurrently (default: 1). "
+                             "Concurrent runs share CPU cores and memory bandwidth, which can skew timings")
     args = parser.parse_args()
+    if args.jobs > 1 and args.py_in_process:
+        parser.error("--py-in-process cannot be combined with --jobs")
+    if args.jobs > 1 and args.pin_core is not None:
+        parser.error("--pin-core cannot be combined with --jobs")
+    if args.pin_core is not None and not hasattr(os, "sched_setaffinity"):
+        parser.error("--pin-core is only supported on Linux")
+    if args.config_stdin and args.py_in_process:
+        parser.error("--py-in-process cannot be combined with --config-stdin")
 
     # Get the language registry
     registry = get_registry(config_file=args.config)
+    registry.flush_log(safe_print)
     
     # Collect all programs with their adapters
     programs = []
@@ -55,6 +134,7 @@ def main():
     if args.py:
         adapter = registry.get_adapter_by_name('python')
         if adapter:
+            adapter.in_process = args.py_in_process
             for py_file in args.py:
                 programs.append({
                     "type": "python",
@@ -69,6 +149,8 @@ def main():
     if args.cpp:
         adapter = registry.get_adapter_by_name('cpp')
         if adapter:
+            if args.cxxflags is not None:
+                adapter.set_flags(args.cxxflags.split())
             for cpp_file in args.cpp:
                 programs.append({
                     "type": "cpp",
@@ -98,6 +180,13 @@ def main():
         print("[ERROR] Need at least 2 programs to benchmark (use --py, --cpp, and/or --jl)")
         sys.exit(1)
     
+    if args.config_stdin:
+        for prog in programs:
+            prog['adapter'].config_mode = "stdin"
+    if args.pin_core is not None:
+        for prog in programs:
+            prog['adapter'].pin_core = args.pin_core
+
     print(f"\n[OK] Benchmarking {len(programs)} programs:")
     for i, prog in enumerate(programs):
         adapter = prog['adapter']
@@ -107,8 +196,13 @@ def main():
     config_blocks = read_config_blocks(args.config)
     print(f"\nFound {len(config_blocks)} configuration block(s)")
 
+    # Start interpreters and compilers once so that their startup is not measured
+    prewarm_interpreters({id(prog['adapter']): prog['adapter'] for prog in programs}.values())
+
     # Prepare all programs (compile if needed)
     print("\n=== Preparing Programs ===")
+    # One after the other: compilations must not contend for the CPU, and warm-up
+    # runs write config.txt/input.txt in the shared working directory
     for prog in programs:
         adapter = prog['adapter']
         safe_print(f"\nPreparing {adapter.display_name} program: {prog['file']}")
@@ -130,18 +224,22 @@ def main():
 
     # Benchmark all configurations
     print("\n=== Running Benchmarks ===")
+    metrics_path = os.path.join(args.output_dir, "all_metrics.json")
     existing_results = []
-    if os.path.exists("results/all_metrics.json"):
+    if os.path.exists(metrics_path):
         try:
-            with open("results/all_metrics.json", "r") as f:
-                existing_results = json.load(f)
+            with open(metrics_path, "rb") as f:
+                existing_results = orjson.loads(f.read())
         except:
             existing_results = []
     all_results = existing_results.copy()
 
+    # Blocks left to measure when running concurrently
+    pending_blocks = []
+
     for idx, config_block in enumerate(config_blocks):
         current_languages = set(prog['type'] for prog in programs)
-        already_measured = False
+        already_measured = any(config == config_block for _, config in pending_blocks)
         for result in all_results:
             if result['config'] == config_block:
                 measured_languages = set(key for key in result.keys() if key != 'config')
@@ -153,8 +251,11 @@ def main():
             print(f"⏭️ Skipping config block #{idx + 1} (already measured with same languages)")
             continue
 
-        print(f"\n--- Configuration Block #{idx + 1} ---")
-        print(f"Config preview: {config_block[:100]}..." if len(config_block) > 100 else f"Config: {config_block}")
+        if args.jobs > 1:
+            pending_blocks.append((idx, config_block))
+            continue
+
+        print_block_header(idx, config_block)
         
         result_entry = {"config": config_block}
         
@@ -165,32 +266,28 @@ def main():
             print(f"\nExecuting {adapter.display_name}...")
             metrics = adapter.execute(prog['prepared_file'], config_block)
             result_entry[prog['type']] = metrics
-            
-            print(f"{adapter.display_name} runtime: {metrics['runtime']:.4f}s")
-            if 'compilation_time' in metrics and metrics['compilation_time'] > 0:
-                print(f"{adapter.display_name} compilation time: {metrics['compilation_time']:.4f}s")
-            print(f"{adapter.display_name} total time: {metrics.get('total_time', metrics['runtime']):.4f}s")
+            print_metrics(adapter, metrics)
         
-        # Calculate speedup (first vs second program)
-        if len(programs) >= 2:
-            prog1_time = result_entry[programs[0]['type']]['runtime']
-            prog2_time = result_entry[programs[1]['type']]['runtime']
-            speedup = prog1_time / prog2_time if prog2_time > 0 else 0
-            print(f"\nSpeedup ({programs[0]['type']} vs {programs[1]['type']}): {speedup:.2f}x")
+        print_speedup(programs, result_entry)
 
         all_results.append(result_entry)
 
+    if pending_blocks:
+        all_results.extend(run_config_blocks_parallel(programs, pending_blocks, args.jobs))
+
     # Cleanup
     print("\n=== Cleaning Up ===")
     for prog in programs:
         adapter = prog['adapter']
         adapter.cleanup(prog.get('prepared_file', ''))
 
-    # Save results
-    os.makedirs("results", exist_ok=True)
-    with open("results/all_metrics.json", "w") as f:
-        json.dump(all_results, f, indent=2)
-    print("\n[OK] Saved all metrics to results/all_metrics.json")
+    # Save results (through a temporary file, so readers never see a partial database)
+    os.makedirs(args.output_dir, exist_ok=True)
+    tmp_path = f"{metrics_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(all_results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    os.replace(tmp_path, metrics_path)
+    print(f"\n[OK] Saved all metrics to {metrics_path}")
     print("[OK] Benchmark complete!")
 
 
@@ -3,6 +3,7 @@
 import numpy as np
 from time import time
 # import matplotlib.pyplot as plt
+import argparse
 import os
 import sys
 
@@ -16,26 +17,43 @@ def updateHalo(u):
     u[sIn, -nHalo:] = u[sIn, nHalo:2*nHalo]
 
 
+# Target working set of one row block in computeRHS (about the size of a L2 cache)
+blockBytes = 2**20
+
 cAdv = np.array([ 1./12, -2./3,  0,    2./3, -1./12])
 cDif = np.array([-1./12,  4./3, -5./2, 4./3, -1./12])
 
 class Problem:
 
-    def __init__(self, fileName):
+    def __init__(self, fileName, dtype=np.float64):
+        # float64 by default : float32 halves memory traffic, but does not
+        # reach the accuracy required by the validation against C++
+        self.dtype = np.dtype(dtype)
+
         with open(fileName, "r") as f:
             inputs = f.read().split()
+        if len(inputs) != 7:
+            raise ValueError(
+                f"{fileName} : expected 7 inputs (nX nY initType flowType viscosity tEnd nSteps),"
+                f" got {len(inputs)}")
 
-        self.nX, self.nY = [int(inputs.pop(0)) for _ in range(2)]
-        self.initType, self.flowType = [inputs.pop(0) for _ in range(2)]
-        self.viscosity, self.tEnd = [float(inputs.pop(0)) for _ in range(2)]
-        self.nSteps = int(inputs.pop(0))
+        self.nX, self.nY = int(inputs[0]), int(inputs[1])
+        self.initType, self.flowType = inputs[2], inputs[3]
+        self.viscosity, self.tEnd = float(inputs[4]), float(inputs[5])
+        self.nSteps = int(inputs[6])
 
         self.setupSolution()
         self.setupCoeffs()
 
         # Additional variable
         self.t = 0
-        self.tmp = np.empty((self.nX, self.nY))
+        self.nRowsBlock = max(1, blockBytes//(4*self.dtype.itemsize*self.nY))
+        self.tmp = np.empty((min(self.nRowsBlock, self.nX), self.nY), dtype=self.dtype)
+
+        # Time-stepping buffers, allocated once
+        self.uEval = np.zeros_like(self.u)
+        self.u1 = np.empty((self.nX, self.nY), dtype=self.dtype)
+        self.k = np.zeros_like(self.u1)
 
     @property
     def grid(self):
@@ -45,7 +63,7 @@ class Problem:
 
 
     def setupSolution(self):
-        self.u = u = np.zeros((self.nX+2*nHalo, self.nY+2*nHalo))
+        self.u = u = np.zeros((self.nX+2*nHalo, self.nY+2*nHalo), dtype=self.dtype)
         initType, (x, y) = self.initType, self.grid
 
         if initType == "gauss":
@@ -61,7 +79,7 @@ class Problem:
 
 
     def setupCoeffs(self):
-        self.coeffs = coeffs = np.zeros((2, 2*nHalo+1, self.nX, self.nY))
+        self.coeffs = coeffs = np.zeros((2, 2*nHalo+1, self.nX, self.nY), dtype=self.dtype)
 
         flowType, viscosity = self.flowType, self.viscosity
         dX, dY, (x, y) = 1/self.nX, 1/self.nY, self.grid
@@ -87,77 +105,94 @@ class Problem:
 
 
     def computeRHS(self, uEval, t, out):
-        coeffs, tmp, nX, nY = self.coeffs, self.tmp, self.nX, self.nY
+        coeffs, nX, nY, nB = self.coeffs, self.nX, self.nY, self.nRowsBlock
 
         updateHalo(uEval)
 
-        out[:] = 0
-        for s in range(2*nHalo+1):
+        # Process blocks of rows so that uEval, tmp and out stay in cache
+        # across all stencil terms
+        for iBeg in range(0, nX, nB):
+            iEnd = min(iBeg+nB, nX)
+            outB, tmp = out[iBeg:iEnd], self.tmp[:iEnd-iBeg]
 
-            # Derivative in X
-            np.copyto(tmp, uEval[s:nX+s, sIn])
-            tmp *= coeffs[0, s]
-            out += tmp
+            # First X term initializes out, saving a zeroing and an addition pass
+            np.copyto(outB, uEval[iBeg:iEnd, sIn])
+            outB *= coeffs[0, 0, iBeg:iEnd]
+            for s in range(2*nHalo+1):
 
-            # Derivative in Y
-            np.copyto(tmp, uEval[sIn, s:nY+s])
-            tmp *= coeffs[1, s]
-            out += tmp
+                # Derivative in X
+                if s > 0:
+                    np.copyto(tmp, uEval[iBeg+s:iEnd+s, sIn])
+                    tmp *= coeffs[0, s, iBeg:iEnd]
+                    outB += tmp
+
+                # Derivative in Y
+                np.copyto(tmp, uEval[nHalo+iBeg:nHalo+iEnd, s:nY+s])
+                tmp *= coeffs[1, s, iBeg:iEnd]
+                outB += tmp
 
 
     def simulate(self):
         u0, nX, nY = self.u, self.nX, self.nY
-        uEval = np.zeros_like(u0)
+        uEval, u1, k = self.uEval, self.u1, self.k
 
-        u1 = np.empty((nX, nY))
-        np.copyto(u1, u0[sIn, sIn])
-        k = np.zeros_like(u1)
+        # Only the inner points of uEval are needed, halos are set by computeRHS
+        u0In, uEvalIn = u0[sIn, sIn], uEval[sIn, sIn]
+        np.copyto(u1, u0In)
 
         dt = self.tEnd/self.nSteps
+        # RK4 stage coefficients, constant over the time loop
+        dt2, dt3, dt6 = dt/2, dt/3, dt/6
+        computeRHS = self.computeRHS
         tBeg = time()
         for i in range(self.nSteps):
             t = self.t
 
-            self.computeRHS(u0, t, k)
-            np.copyto(uEval[sIn, sIn], k)
-            k *= dt/6; u1 += k
+            computeRHS(u0, t, k)
+            np.multiply(k, dt2, out=uEvalIn); uEvalIn += u0In
+            k *= dt6; u1 += k
 
-            uEval *= dt/2
-            uEval += u0
-            self.computeRHS(uEval, t+dt/2, k)
-            np.copyto(uEval[sIn, sIn], k)
-            k *= dt/3; u1 += k
+            computeRHS(uEval, t+dt2, k)
+            np.multiply(k, dt2, out=uEvalIn); uEvalIn += u0In
+            k *= dt3; u1 += k
 
-            uEval *= dt/2
-            uEval += u0
-            self.computeRHS(uEval, t+dt/2, k)
-            np.copyto(uEval[sIn, sIn], k)
-            k *= dt/3; u1 += k
+            computeRHS(uEval, t+dt2, k)
+            np.multiply(k, dt, out=uEvalIn); uEvalIn += u0In
+            k *= dt3; u1 += k
 
-            uEval *= dt
-            uEval += u0
-            self.computeRHS(uEval, t+dt, k)
-            k *= dt/6; u1 += k
+            computeRHS(uEval, t+dt, k)
+            k *= dt6; u1 += k
 
-            np.copyto(u0[sIn, sIn], u1)
+            np.copyto(u0In, u1)
             self.t = (i+1)*dt
 
         tWall = time()-tBeg
         print(f"tWall : {tWall}")
         print(f"tWall/DoF : {tWall/(self.nSteps*nX*nY)}")
 
-if __name__ == "__main__":
+
+def main(argv=None):
+    # Optional precision override, e.g. "python program.py --precision float32"
+    parser = argparse.ArgumentParser(description="Advection-diffusion solver (parameters read from input.txt)")
+    parser.add_argument("--precision", choices=["float32", "float64"], default="float64",
+                        help="Floating-point precision of the solution (default: float64)")
+    args = parser.parse_args(argv)
+
     # Simulation
-    p = Problem("input.txt")
-    u0 = p.u.copy()
+    p = Problem("input.txt", dtype=args.precision)
 
     # Save initial state
-    np.savetxt("uInit.txt", u0[sIn, sIn])
+    np.savetxt("uInit.txt", p.u[sIn, sIn])
 
     p.simulate()
 
     # Save final state
     np.savetxt("uEnd.txt", p.u[sIn, sIn])
+    return p
+
+
+if __name__ == "__main__":
+    main()
 # uEnd = np.abs(p.u)  # remove some negative artefacts for plots
 
 # # Plotting
@@ -14,7 +14,7 @@ def cpp_convergence_test(base_dir, temp_dir):
     binary_name = "program_cpp.exe" if platform.system() == "Windows" else "program_cpp"
     binary_path = base_dir / binary_name
     
-    compiler = ["g++", str(cpp_file), "-O2", "-o", str(binary_path)]
+    compiler = ["g++", str(cpp_file), "-O3", "-march=native", "-DNDEBUG", "-o", str(binary_path)]
     subprocess.run(compiler, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     nX0 = 32
@@ -1,54 +1,87 @@
+import hashlib
+import re
 import subprocess
 import sys
-import json
 import os
+from collections import deque
 
+import orjson
 
-def run_benchmark(program1_file, program1_lang, program2_file, program2_lang, config_file):
+# Progress lines printed by diagnosetool.py
+_BLOCK_COUNT_RE = re.compile(r'^Found (\d+) configuration block')
+_BLOCK_START_RE = re.compile(r'(?:Configuration Block|Skipping config block) #(\d+)')
+
+# Run in place from the app directory, whatever the working directory of the benchmark
+_DIAGNOSETOOL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'scripts', 'diagnosetool.py')
+
+# diagnosetool.py command-line flag of each language
+_LANG_FLAGS = {
+    'python': '--py',
+    'cpp': '--cpp',
+    'julia': '--jl'
+}
+
+# Number of output lines kept for error reporting
+_OUTPUT_TAIL_LINES = 200
+
+
+def compute_benchmark_key(program1_code, program1_lang, program2_code, program2_lang, config_content):
+    # Content hash of everything that determines the outcome of a benchmark run
+    # (file contents are bytes, languages are str)
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (program1_code, program1_lang, program2_code, program2_lang, config_content):
+        digest.update(part if isinstance(part, bytes) else part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def parse_progress_line(line):
+    # Returns ('total', n) for the block count, ('block', k) when block #k is reached, None otherwise
+    match = _BLOCK_COUNT_RE.match(line)
+    if match:
+        return 'total', int(match.group(1))
+    match = _BLOCK_START_RE.search(line)
+    if match:
+        return 'block', int(match.group(1))
+    return None
+
+
+def run_benchmark(program1_file, program1_lang, program2_file, program2_lang, config_file, on_output=None,
+                  output_dir='results', cwd=None):
     try:
-        # Build command based on languages
-        cmd = [sys.executable, 'diagnosetool.py']
-        
-        # Map language names to command-line flags
-        lang_flag_map = {
-            'python': '--py',
-            'cpp': '--cpp',
-            'julia': '--jl'
-        }
-        
-        # Add program 1
-        flag1 = lang_flag_map.get(program1_lang)
-        if flag1:
-            cmd.extend([flag1, program1_file])
-        else:
-            return False, f"Unsupported language: {program1_lang}"
-        
-        # Add program 2
-        flag2 = lang_flag_map.get(program2_lang)
-        if flag2:
-            cmd.extend([flag2, program2_file])
-        else:
-            return False, f"Unsupported language: {program2_lang}"
-        
-        # Add config
-        cmd.extend(['--config', config_file])
+        # Build command based on languages (unbuffered so progress lines arrive as they are printed)
+        cmd = [sys.executable, '-u', _DIAGNOSETOOL_PATH]
+        for program_file, program_lang in ((program1_file, program1_lang), (program2_file, program2_lang)):
+            flag = _LANG_FLAGS.get(program_lang)
+            if not flag:
+                return False, f"Unsupported language: {program_lang}"
+            cmd.extend([flag, program_file])
+        cmd.extend(['--config', config_file, '--output-dir', output_dir])
         
-        # Run the benchmark
-        result = subprocess.run(
+        # Run the benchmark, streaming its output line by line
+        output_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            cwd=os.getcwd()
-        )
+            bufsize=1,
+            cwd=cwd
+        ) as proc:
+            for line in proc.stdout:
+                output_tail.append(line)
+                if on_output:
+                    on_output(line)
         
-        if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
+        if proc.returncode != 0:
+            error_msg = ''.join(output_tail).strip()
             return False, f"Benchmark failed:\n{error_msg}\nCommand: {' '.join(cmd)}"
         
         # Load results
         try:
-            with open('results/all_metrics.json', 'r') as f:
-                raw_results = json.load(f)
+            with open(os.path.join(output_dir, 'all_metrics.json'), 'rb') as f:
+                raw_results = orjson.loads(f.read())
             
             # Import the formatting function from results_utils
             from .results_utils import format_benchmark_results
@@ -0,0 +1,96 @@
+import os
+import orjson
+import streamlit as st
+
+from scripts.create_bar_chart import create_bar_chart
+from scripts.create_loglog_chart import create_loglog_chart, create_loglog_chart_total
+from scripts.create_difference_chart import create_difference_chart
+from scripts.create_results_table import create_results_table
+from scripts.create_csv_data import create_csv_data
+from scripts.create_download_package import create_download_package
+
+# Charts and tables only change with the results, so they are cached across reruns.
+# Results are passed as their JSON serialization, which is a cheap and stable cache key.
+
+
+def results_key(results):
+    return orjson.dumps(results)
+
+
+def _read_png(path):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@st.cache_data
+def cached_loglog_chart(results_json):
+    return _read_png(create_loglog_chart(orjson.loads(results_json)))
+
+
+@st.cache_data
+def cached_loglog_chart_total(results_json):
+    return _read_png(create_loglog_chart_total(orjson.loads(results_json)))
+
+
+@st.cache_data
+def _cached_difference_chart(json_path, mtime):
+    return _read_png(create_difference_chart(json_path))
+
+
+def cached_difference_chart(json_path):
+    # The chart is built from the metrics database, so its modification time is part of the key
+    mtime = os.path.getmtime(json_path) if os.path.exists(json_path) else None
+    return _cached_difference_chart(json_path, mtime)
+
+
+@st.cache_resource
+def _png_bytes(path, mtime):
+    return _read_png(path)
+
+
+def png_bytes(path):
+    # Images written by previous runs are read once per version of the file;
+    # None if the file has been removed since it was found
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _png_bytes(path, mtime)
+
+
+@st.cache_data
+def cached_bar_chart(results_json):
+    return create_bar_chart(orjson.loads(results_json))
+
+
+@st.cache_data
+def cached_results_table(results_json):
+    return create_results_table(orjson.loads(results_json))
+
+
+@st.cache_data
+def cached_csv_text(results_json):
+    csv_data = create_csv_data(orjson.loads(results_json), table=cached_results_table(results_json))
+    return None if csv_data is None else csv_data.to_csv(index=False)
+
+
+@st.cache_data
+def _cached_download_package(results_json, image_mtime):
+    results = orjson.loads(results_json)
+    zip_path = create_download_package(
+        results, csv_data=create_csv_data(results, table=cached_results_table(results_json))
+    )
+    try:
+        with open(zip_path, 'rb') as f:
+            return f.read()
+    finally:
+        os.remove(zip_path)
+
+
+def cached_download_package(results_json):
+    # The package also contains the runtime comparison image, so its modification time is part of the key
+    image_path = os.path.join('results', 'runtime_comparison.png')
+    mtime = os.path.getmtime(image_path) if os.path.exists(image_path) else None
+    return _cached_download_package(results_json, mtime)
@@ -1,27 +1,32 @@
 import sys
-import re
+from itertools import chain
+
+# Emojis and other symbols that non-UTF-8 consoles cannot encode,
+# as a str.translate() table that deletes them
+_EMOJI_TABLE = dict.fromkeys(chain(
+    range(0x1F300, 0x1FA00),  # Emoticons
+    range(0x1F600, 0x1F650),  # Emoticons 2
+    range(0x1F680, 0x1F700),  # Transport & Map Symbols
+    range(0x1F1E0, 0x1F200),  # Flags
+    range(0x2700, 0x27C0),    # Dingbats
+    range(0xFE00, 0xFE10),    # Variation Selectors
+    range(0x2600, 0x2700),    # Miscellaneous Symbols
+))
 
 def safe_print(text, file=None):
     if file is None:
         file = sys.stdout
     
+    # Any console encoding can print ASCII, no fallback needed
+    if isinstance(text, str) and text.isascii():
+        print(text, file=file)
+        return
+    
     try:
         print(text, file=file)
     except (UnicodeEncodeError, UnicodeError):
         # Remove emojis and problematic Unicode characters
-        # Emoji range: U+1F300 to U+1F9FF (plus some other ranges)
-        text_no_emoji = re.sub(
-            r'[\U0001F300-\U0001F9FF'  # Emoticons
-            r'\U0001F600-\U0001F64F'   # Emoticons 2
-            r'\U0001F680-\U0001F6FF'   # Transport & Map Symbols
-            r'\U0001F1E0-\U0001F1FF'   # Flags
-            r'\U00002700-\U000027BF'   # Dingbats
-            r'\U0000FE00-\U0000FE0F'   # Variation Selectors
-            r'\U00002600-\U000026FF'   # Miscellaneous Symbols
-            r']+', 
-            '', 
-            text
-        )
+        text_no_emoji = text.translate(_EMOJI_TABLE)
         print(text_no_emoji.strip(), file=file)
 
 
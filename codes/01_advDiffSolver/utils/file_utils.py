@@ -1,5 +1,23 @@
+import os
+
 from adapters.registry import get_registry
 
 def detect_language(filename):
     registry = get_registry()
     return registry.detect_language(filename) or 'unknown'
+
+
+# PNG files diagnosetool.py may leave in the results directory
+RESULT_ARTIFACTS = {
+    'performance_comparison': 'performance_comparison.png',
+    'runtime_by_input': 'runtime_by_input.png',
+}
+
+
+def find_result_artifacts(results_dir):
+    # Path of each result image that exists (None otherwise), checked once per benchmark run
+    artifacts = {}
+    for name, filename in RESULT_ARTIFACTS.items():
+        path = os.path.join(results_dir, filename)
+        artifacts[name] = path if os.path.isfile(path) else None
+    return artifacts
@@ -1,37 +1,47 @@
+from types import MappingProxyType
+
+import numpy as np
+
+# Read-only stand-in for the metrics of a language missing from a test case
+_EMPTY = MappingProxyType({})
+
+
+def _format_program_metrics(metrics):
+    runtime = metrics.get('runtime', 0)
+    return {
+        'runtime': runtime,
+        'total_time': metrics.get('total_time', runtime),
+        'compilation_time': metrics.get('compilation_time', 0),
+        'returncode': metrics.get('returncode', 0)
+    }
+
+
+def _format_test_case(test_case, program1_lang, program2_lang):
+    # Each language's metrics are looked up once; missing ones read as the shared empty mapping
+    case = {
+        'config': test_case.get('config', ''),
+        'program1': _format_program_metrics(test_case.get(program1_lang) or _EMPTY),
+        'program2': _format_program_metrics(test_case.get(program2_lang) or _EMPTY)
+    }
+    
+    # Compute speedups once here; tables, summaries and exports reuse them
+    prog1, prog2 = case['program1'], case['program2']
+    case['speedup'] = prog1['runtime'] / prog2['runtime'] if prog2['runtime'] > 0 else 0
+    case['total_speedup'] = prog1['total_time'] / prog2['total_time'] if prog2['total_time'] > 0 else 0
+    return case
+
+
 def format_benchmark_results(raw_results, program1_lang, program2_lang):
-    formatted_results = {
-        'test_cases': {},
+    return {
+        'test_cases': {
+            f"Test Case {i+1}": _format_test_case(test_case, program1_lang, program2_lang)
+            for i, test_case in enumerate(raw_results)
+        },
         'languages': {
             'program1': program1_lang,
             'program2': program2_lang
         }
     }
-    
-    for i, test_case in enumerate(raw_results):
-        case_name = f"Test Case {i+1}"
-        
-        # Extract config preview (first line or truncated)
-        config_preview = test_case.get('config', '')[:50]
-        
-        formatted_results['test_cases'][case_name] = {
-            'config': test_case.get('config', ''),
-            'program1': {
-                'runtime': test_case.get(program1_lang, {}).get('runtime', 0),
-                'total_time': test_case.get(program1_lang, {}).get('total_time', 
-                                test_case.get(program1_lang, {}).get('runtime', 0)),
-                'compilation_time': test_case.get(program1_lang, {}).get('compilation_time', 0),
-                'returncode': test_case.get(program1_lang, {}).get('returncode', 0)
-            },
-            'program2': {
-                'runtime': test_case.get(program2_lang, {}).get('runtime', 0),
-                'total_time': test_case.get(program2_lang, {}).get('total_time', 
-                                test_case.get(program2_lang, {}).get('runtime', 0)),
-                'compilation_time': test_case.get(program2_lang, {}).get('compilation_time', 0),
-                'returncode': test_case.get(program2_lang, {}).get('returncode', 0)
-            }
-        }
-    
-    return formatted_results
 
 
 def calculate_summary_metrics(results):
@@ -43,31 +53,31 @@ def calculate_summary_metrics(results):
     if not test_cases:
         return None
     
+    # One float array per quantity, reduced by NumPy
+    cases = list(test_cases.values())
+    
+    def column(values):
+        return np.fromiter(values, dtype=np.float64, count=len(cases))
+    
     # Extract runtime values
-    prog1_times = [case['program1']['runtime'] for case in test_cases.values()]
-    prog2_times = [case['program2']['runtime'] for case in test_cases.values()]
+    prog1_times = column(case['program1']['runtime'] for case in cases)
+    prog2_times = column(case['program2']['runtime'] for case in cases)
     
     # Extract total time values
-    prog1_total_times = [
-        case['program1'].get('total_time', case['program1']['runtime']) 
-        for case in test_cases.values()
-    ]
-    prog2_total_times = [
-        case['program2'].get('total_time', case['program2']['runtime']) 
-        for case in test_cases.values()
-    ]
+    prog1_total_times = column(case['program1'].get('total_time', case['program1']['runtime']) for case in cases)
+    prog2_total_times = column(case['program2'].get('total_time', case['program2']['runtime']) for case in cases)
     
-    # Calculate speedups
-    speedups = [p1/p2 for p1, p2 in zip(prog1_times, prog2_times) if p2 > 0]
-    total_speedups = [p1/p2 for p1, p2 in zip(prog1_total_times, prog2_total_times) if p2 > 0]
+    # Collect speedups (only defined where program 2 took some time)
+    speedups = column(case['speedup'] for case in cases)[prog2_times > 0]
+    total_speedups = column(case['total_speedup'] for case in cases)[prog2_total_times > 0]
     
     return {
-        'num_test_cases': len(test_cases),
-        'prog1_avg_runtime': sum(prog1_times) / len(prog1_times) if prog1_times else 0,
-        'prog2_avg_runtime': sum(prog2_times) / len(prog2_times) if prog2_times else 0,
-        'prog1_avg_total': sum(prog1_total_times) / len(prog1_total_times) if prog1_total_times else 0,
-        'prog2_avg_total': sum(prog2_total_times) / len(prog2_total_times) if prog2_total_times else 0,
-        'avg_speedup': sum(speedups) / len(speedups) if speedups else 0,
-        'avg_total_speedup': sum(total_speedups) / len(total_speedups) if total_speedups else 0,
-        'max_speedup': max(speedups) if speedups else 0
+        'num_test_cases': len(cases),
+        'prog1_avg_runtime': float(prog1_times.mean()),
+        'prog2_avg_runtime': float(prog2_times.mean()),
+        'prog1_avg_total': float(prog1_total_times.mean()),
+        'prog2_avg_total': float(prog2_total_times.mean()),
+        'avg_speedup': float(speedups.mean()) if speedups.size else 0,
+        'avg_total_speedup': float(total_speedups.mean()) if total_speedups.size else 0,
+        'max_speedup': float(speedups.max()) if speedups.size else 0
     }
@@ -3,15 +3,18 @@ import streamlit as st
 
 def init_session_state():
     defaults = {
-        'program1_code': '', 
+        'program1_code': b'', 
         'program1_filename': '', 
         'program1_language': '',
-        'program2_code': '', 
+        'program2_code': b'', 
         'program2_filename': '', 
         'program2_language': '',
-        'config_content': '', 
+        'config_content': b'', 
         'config_filename': '', 
-        'benchmark_results': None
+        'benchmark_results': None,
+        'benchmark_key': None,
+        'result_artifacts': None,
+        'zip_ready': False
     }
     
     for key, value in defaults.items():
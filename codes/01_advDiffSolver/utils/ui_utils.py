@@ -1,29 +1,45 @@
 import os
 import streamlit as st
 
+_CSS_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'styles.css')
+_SECTION_HEADER_TEMPLATE = '<div class="section-header">{}</div>'
+
+_LANGUAGE_EMOJIS = {
+    "python": "🐍",
+    "cpp": "⚙️",
+    "julia": "🔬"
+}
+
+_LANGUAGE_DISPLAY_NAMES = {
+    "python": "python",
+    "cpp": "cpp",
+    "julia": "julia"
+}
+
+
+@st.cache_resource
+def _read_custom_css():
+    # Read and wrap the stylesheet once per server process instead of on every rerun
+    if not os.path.exists(_CSS_FILE):
+        return None
+    with open(_CSS_FILE, 'r', encoding='utf-8') as f:
+        return f'<style>{f.read()}</style>'
+
+
 def load_custom_css():
-    css_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'styles.css')
-    
-    if os.path.exists(css_file):
-        with open(css_file, 'r', encoding='utf-8') as f:
-            st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+    # The page is rebuilt on each rerun, so the style block itself must still be emitted
+    css = _read_custom_css()
+    if css:
+        st.markdown(css, unsafe_allow_html=True)
+
+
+def section_header(title):
+    st.markdown(_SECTION_HEADER_TEMPLATE.format(title), unsafe_allow_html=True)
 
 
 def get_language_emoji(language):
-    emoji_map = {
-        "python": "🐍",
-        "cpp": "⚙️",
-        "julia": "🔬"
-    }
-    
-    return emoji_map.get(language, "📄")
+    return _LANGUAGE_EMOJIS.get(language, "📄")
 
 
 def get_language_display_name(language):
-    display_map = {
-        "python": "python",
-        "cpp": "cpp",
-        "julia": "julia"
-    }
-    
-    return display_map.get(language, "text")
+    return _LANGUAGE_DISPLAY_NAMES.get(language, "text")